@@ -541,15 +541,18 @@ class MainWindow(QMainWindow):
         """
         Handle data import completion.
 
-        Refreshes the client list to show newly imported clients.
-        """
-        logger.info("Data imported, refreshing client list")
-
-        # Refresh the client list to show imported clients
-        if "clients" in self.views:
-            view = self.views["clients"]
-            if hasattr(view, "refresh"):
-                view.refresh()
+        Refreshes the client list and inventory to show the imported data.
+        """
+        logger.info("Data imported, refreshing client list and inventory")
+
+        # Refresh the views that list imported records
+        # WHY inventory too: Imports can add inventory items, and the
+        # inventory view keeps loaded pages cached until it is refreshed
+        for view_id in ("clients", "inventory"):
+            if view_id in self.views:
+                view = self.views[view_id]
+                if hasattr(view, "refresh"):
+                    view.refresh()
 
     def _is_dark_theme(self, theme_name: str) -> bool:
         """
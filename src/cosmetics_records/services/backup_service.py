@@ -34,6 +34,7 @@
 # =============================================================================
 
 import logging
+import os
 import shutil
 import zipfile
 from datetime import datetime
@@ -271,15 +272,26 @@ class BackupService:
 
             # Scan backup directory for ZIP files
             # We look for files matching our naming pattern
-            for file_path in self.backup_dir.glob("cosmetics_records_backup_*.zip"):
+            # WHY os.scandir: Names come from a single directory read, and
+            # the entries are reused for stat() instead of resolving each
+            # path again as glob() + Path.stat() would
+            with os.scandir(self.backup_dir.absolute()) as entries:
+                backup_entries = [
+                    entry
+                    for entry in entries
+                    if entry.name.startswith("cosmetics_records_backup_")
+                    and entry.name.endswith(".zip")
+                ]
+
+            for entry in backup_entries:
                 try:
                     # Get file metadata
-                    stat = file_path.stat()
+                    stat = entry.stat()
 
                     # Parse creation date from filename if possible
                     # New format: cosmetics_records_backup_vX.Y.Z_YYYYMMDD_HHMMSS.zip
                     # Old format: cosmetics_records_backup_YYYYMMDD_HHMMSS.zip
-                    filename = file_path.name
+                    filename = entry.name
                     try:
                         # Remove prefix and suffix
                         timestamp_str = filename.replace(
@@ -301,7 +313,7 @@ class BackupService:
                         created = datetime.fromtimestamp(stat.st_mtime)
 
                     backup_info = {
-                        "path": str(file_path.absolute()),
+                        "path": entry.path,
                         "filename": filename,
                         "size": stat.st_size,  # Size in bytes
                         "created": created,
@@ -311,7 +323,7 @@ class BackupService:
 
                 except Exception as e:
                     # If we can't read a particular file, log it and continue
-                    logger.warning(f"Error reading backup file {file_path}: {e}")
+                    logger.warning(f"Error reading backup file {entry.path}: {e}")
                     continue
 
             # Sort by creation date (newest first)
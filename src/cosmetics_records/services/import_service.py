@@ -51,10 +51,12 @@
 
 import csv
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, TextIO, Tuple
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
 
 from cosmetics_records.database.connection import DatabaseConnection
 from cosmetics_records.models.client import Client
@@ -64,6 +66,21 @@ from cosmetics_records.utils.validators import is_valid_email
 # Configure module logger for debugging import operations
 logger = logging.getLogger(__name__)
 
+# Number of rows written per executemany() call during import
+# WHY batches: One executemany() per batch avoids a Python round trip per
+# row, while the parameter list held in memory stays bounded
+IMPORT_BATCH_SIZE = 5000
+
+# Number of bytes read to check that a file looks like a CSV file
+# WHY 4 KB: Enough to contain the header row and a few data rows
+SNIFF_SIZE = 4096
+
+# (path, size, mtime in ns) of one selected file, or None if unset
+FileStat = Optional[Tuple[str, int, int]]
+
+# FileStat per validate_files() argument, see ImportService._file_signature()
+FileSignature = Tuple[FileStat, ...]
+
 
 # =============================================================================
 # Data Classes for Import Results
@@ -189,6 +206,8 @@ class ImportService:
         _inventory_path: Path to inventory CSV file (optional)
         _parsed_data: Parsed and validated data ready for import
         _errors: List of validation errors
+        _validated_signature: Paths, sizes and modification times of the
+                              files the current result was computed from
     """
 
     # Required columns for each CSV file type
@@ -227,6 +246,7 @@ class ImportService:
         self._inventory_path: Optional[Path] = None
         self._parsed_data: Optional[ParsedData] = None
         self._errors: List[ValidationError] = []
+        self._validated_signature: Optional[FileSignature] = None
 
         logger.debug("ImportService initialized")
 
@@ -293,7 +313,17 @@ class ImportService:
             ... else:
             ...     print("Validation passed!")
         """
+        # Reuse the previous result if the same files are unchanged
+        # WHY: Validating again (e.g. after a failed import) would re-parse
+        # every file only to produce the same errors and parsed data
+        paths = (clients_path, treatments_path, products_path, inventory_path)
+        signature = self._file_signature(paths)
+        if signature is not None and signature == self._validated_signature:
+            logger.info("Files unchanged since last validation, reusing result")
+            return self._errors
+
         # Reset state for new validation
+        self._validated_signature = None
         self._errors = []
         self._parsed_data = ParsedData()
 
@@ -375,8 +405,34 @@ class ImportService:
             self._parse_inventory_csv()
 
         logger.info(f"Validation complete: {len(self._errors)} errors found")
+        self._validated_signature = signature
         return self._errors
 
+    def _file_signature(
+        self, paths: Tuple[Optional[str], ...]
+    ) -> Optional[FileSignature]:
+        """
+        Build a signature that changes whenever a selected file changes.
+
+        Args:
+            paths: CSV paths in validate_files() argument order (None if unset)
+
+        Returns:
+            Tuple of (path, size, mtime) per argument, or None if a selected
+            file cannot be checked (the files are then always validated)
+        """
+        signature: List[FileStat] = []
+        for path in paths:
+            if not path:
+                signature.append(None)
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            signature.append((path, stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
     def get_preview(self) -> Optional[ImportPreview]:
         """
         Get a preview of what will be imported.
@@ -480,6 +536,10 @@ class ImportService:
                 # Commit the transaction
                 db.commit()
 
+                # The data is in the database now, so validating the same
+                # files again must not hand it out for a second import
+                self._validated_signature = None
+
                 logger.info(
                     f"Import complete: {clients_count} clients, "
                     f"{treatments_count} treatments, {products_count} products, "
@@ -573,6 +633,35 @@ class ImportService:
             logger.debug("Could not detect delimiter, defaulting to comma")
             return ","
 
+    def _sniff(self, path: Path) -> Optional[str]:
+        """
+        Check the start of a file for signs that it is not a CSV file.
+
+        Only the first SNIFF_SIZE bytes are read, so this is instant even for
+        large files.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Error message if the file is clearly not a CSV file, else None
+        """
+        try:
+            with open(path, "rb") as f:
+                sample = f.read(SNIFF_SIZE)
+        except OSError as e:
+            return f"Cannot read file: {e}"
+
+        # NUL bytes never appear in text files, but do in Excel/zip files
+        if b"\x00" in sample:
+            return "Not a CSV file (binary content, e.g. an Excel file)"
+
+        # Every import file has several columns, so a delimiter must appear
+        if sample and not any(d in sample for d in (b",", b";", b"\t")):
+            return "Not a CSV file (no comma, semicolon or tab found)"
+
+        return None
+
     def _validate_file_exists(self, path: Path, required: bool = False) -> None:
         """
         Check if a file exists and is readable.
@@ -592,6 +681,14 @@ class ImportService:
             self._add_error(display_name, None, None, "Not a file")
             return
 
+        # Reject obviously non-CSV files before the encoding detection
+        # WHY: Latin-1 decodes any bytes, so e.g. an .xlsx would otherwise be
+        # parsed in full and only fail later with confusing column errors
+        sniff_error = self._sniff(path)
+        if sniff_error:
+            self._add_error(display_name, None, None, sniff_error)
+            return
+
         # Try to open with encoding detection
         f, encoding = self._try_open_csv(path)
         if f is None:
@@ -1181,26 +1278,25 @@ class ImportService:
         if not self._parsed_data or not self._parsed_data.inventory:
             return 0
 
-        count = 0
-        for item_data in self._parsed_data.inventory:
-            # Create inventory item model
-            item = InventoryItem(
-                name=item_data["name"],
-                description=item_data["description"],
-                capacity=item_data["capacity"],
-                unit=item_data["unit"],
-            )
+        inventory = self._parsed_data.inventory
 
-            # Insert into database
-            query = """
-                INSERT INTO inventory (name, description, capacity, unit)
-                VALUES (?, ?, ?, ?)
-            """
-            db.execute(
-                query,
-                (item.name, item.description, item.capacity, item.unit),
-            )
-            count += 1
+        def rows() -> Iterable[Tuple[Any, ...]]:
+            for item_data in inventory:
+                # Create inventory item model
+                item = InventoryItem(
+                    name=item_data["name"],
+                    description=item_data["description"],
+                    capacity=item_data["capacity"],
+                    unit=item_data["unit"],
+                )
+                yield (item.name, item.description, item.capacity, item.unit)
+
+        # Insert into database
+        query = """
+            INSERT INTO inventory (name, description, capacity, unit)
+            VALUES (?, ?, ?, ?)
+        """
+        count = self._insert_batched(db, query, rows())
 
         logger.debug(f"Imported {count} inventory items")
         return count
@@ -1287,33 +1383,33 @@ class ImportService:
         if not self._parsed_data or not self._parsed_data.treatments:
             return 0
 
-        count = 0
-        for client_import_id, treatment_data in self._parsed_data.treatments:
-            # Look up the actual database client ID
-            client_id = client_id_mapping.get(client_import_id)
-            if client_id is None:
-                # This shouldn't happen after validation, but be safe
-                logger.warning(
-                    f"Skipping treatment: client_import_id "
-                    f"'{client_import_id}' not found"
-                )
-                continue
+        treatments = self._parsed_data.treatments
+
+        def rows() -> Iterable[Tuple[Any, ...]]:
+            for client_import_id, treatment_data in treatments:
+                # Look up the actual database client ID
+                client_id = client_id_mapping.get(client_import_id)
+                if client_id is None:
+                    # This shouldn't happen after validation, but be safe
+                    logger.warning(
+                        f"Skipping treatment: client_import_id "
+                        f"'{client_import_id}' not found"
+                    )
+                    continue
 
-            # Insert into database
-            query = """
-                INSERT INTO treatment_records
-                (client_id, treatment_date, treatment_notes)
-                VALUES (?, ?, ?)
-            """
-            db.execute(
-                query,
-                (
+                yield (
                     client_id,
                     treatment_data["treatment_date"],
                     treatment_data["treatment_notes"],
-                ),
-            )
-            count += 1
+                )
+
+        # Insert into database
+        query = """
+            INSERT INTO treatment_records
+            (client_id, treatment_date, treatment_notes)
+            VALUES (?, ?, ?)
+        """
+        count = self._insert_batched(db, query, rows())
 
         logger.debug(f"Imported {count} treatments")
         return count
@@ -1334,31 +1430,62 @@ class ImportService:
         if not self._parsed_data or not self._parsed_data.products:
             return 0
 
-        count = 0
-        for client_import_id, product_data in self._parsed_data.products:
-            # Look up the actual database client ID
-            client_id = client_id_mapping.get(client_import_id)
-            if client_id is None:
-                # This shouldn't happen after validation, but be safe
-                logger.warning(
-                    f"Skipping product: client_import_id '{client_import_id}' not found"
-                )
-                continue
+        products = self._parsed_data.products
+
+        def rows() -> Iterable[Tuple[Any, ...]]:
+            for client_import_id, product_data in products:
+                # Look up the actual database client ID
+                client_id = client_id_mapping.get(client_import_id)
+                if client_id is None:
+                    # This shouldn't happen after validation, but be safe
+                    logger.warning(
+                        f"Skipping product: client_import_id "
+                        f"'{client_import_id}' not found"
+                    )
+                    continue
 
-            # Insert into database
-            query = """
-                INSERT INTO product_records (client_id, product_date, product_text)
-                VALUES (?, ?, ?)
-            """
-            db.execute(
-                query,
-                (
+                yield (
                     client_id,
                     product_data["product_date"],
                     product_data["product_text"],
-                ),
-            )
-            count += 1
+                )
+
+        # Insert into database
+        query = """
+            INSERT INTO product_records (client_id, product_date, product_text)
+            VALUES (?, ?, ?)
+        """
+        count = self._insert_batched(db, query, rows())
 
         logger.debug(f"Imported {count} products")
         return count
+
+    def _insert_batched(
+        self,
+        db: DatabaseConnection,
+        query: str,
+        rows: Iterable[Tuple[Any, ...]],
+    ) -> int:
+        """
+        Insert rows with one executemany() call per IMPORT_BATCH_SIZE rows.
+
+        All batches run in the caller's transaction, so the import stays
+        all-or-nothing.
+
+        Args:
+            db: Active database connection
+            query: INSERT statement with ? placeholders
+            rows: Parameter tuples, one per row to insert
+
+        Returns:
+            Number of rows inserted
+        """
+        count = 0
+        rows_iter = iter(rows)
+        while True:
+            batch = list(islice(rows_iter, IMPORT_BATCH_SIZE))
+            if not batch:
+                break
+            db.executemany(query, batch)
+            count += len(batch)
+        return count
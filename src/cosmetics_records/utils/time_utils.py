@@ -18,6 +18,7 @@
 # =============================================================================
 
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Union
 
 
@@ -153,6 +154,26 @@ LANGUAGE_DATE_FORMATS = {
 }
 
 
+@lru_cache(maxsize=128)
+def _strftime_cached(d: Union[date, datetime], fmt: str) -> str:
+    """
+    Format a date with the given format string, memoizing the result.
+
+    WHY cache: The same dates are formatted over and over (today's date in
+    every add dialog, the dates of every history entry on each reload).
+    date and datetime are immutable and hashable, and including the format
+    in the key means a changed date format setting is picked up immediately.
+
+    Args:
+        d: A date or datetime object to format
+        fmt: strftime format string
+
+    Returns:
+        The formatted date string
+    """
+    return d.strftime(fmt)
+
+
 def format_date_localized(d: Union[date, datetime]) -> str:
     """
     Format a date according to the user's date format preference.
@@ -187,4 +208,4 @@ def format_date_localized(d: Union[date, datetime]) -> str:
         # Use explicit format setting
         fmt = DATE_FORMATS.get(date_format_setting, "%Y-%m-%d")
 
-    return d.strftime(fmt)
+    return _strftime_cached(d, fmt)
@@ -24,7 +24,7 @@
 # =============================================================================
 
 import logging
-from typing import List, Optional, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 from PyQt6.QtCore import QEvent, QObject
 
@@ -39,7 +39,7 @@ from PyQt6.QtWidgets import (
 
 # Try to import thefuzz for fuzzy matching
 try:
-    from thefuzz import fuzz
+    from thefuzz import fuzz, process
 
     FUZZ_AVAILABLE = True
 except ImportError:
@@ -65,6 +65,8 @@ class Autocomplete(QWidget):
 
     Attributes:
         _suggestions: Full list of available suggestions
+        _choices: Case-folded copies of _suggestions by index, used for matching
+        _result_cache: Filter results by normalized query
         _line_edit: The input field
         _suggestions_list: The dropdown suggestions list
     """
@@ -80,6 +82,18 @@ class Autocomplete(QWidget):
     # Maximum suggestions to show
     MAX_SUGGESTIONS = 10
 
+    # Maximum number of queries whose filter results are cached
+    # WHY: Typing and backspacing revisits the same prefixes, so recent
+    # results are kept instead of scoring all suggestions again
+    RESULT_CACHE_SIZE = 128
+
+    # Suggestion list prepared for matching, shared by all instances
+    # WHY class level: Dialogs with product autocomplete are opened many times
+    # per session with the same inventory names. The prepared list is built
+    # once and reused by every new instance until the names change.
+    _shared_suggestions: Tuple[str, ...] = ()
+    _shared_choices: Dict[int, str] = {}
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the autocomplete input.
@@ -90,7 +104,9 @@ class Autocomplete(QWidget):
         super().__init__(parent)
 
         # State tracking
-        self._suggestions: List[str] = []
+        self._suggestions: Tuple[str, ...] = ()
+        self._choices: Dict[int, str] = {}
+        self._result_cache: Dict[str, List[str]] = {}
 
         # Set up the UI
         self._init_ui()
@@ -249,29 +265,48 @@ class Autocomplete(QWidget):
         if not self._suggestions:
             return []
 
-        query = query.lower().strip()
+        # WHY casefold: Normalizes case like lower(), but also folds characters
+        # such as "ß" to "ss", so German product names match either spelling.
+        # The suggestions were folded once in set_suggestions().
+        query = query.strip().casefold()
+
+        # Reuse the result if this query was filtered before
+        cached = self._result_cache.get(query)
+        if cached is not None:
+            return cached
 
         if FUZZ_AVAILABLE:
             # Use fuzzy matching with scoring
-            scored_suggestions = []
-
-            for suggestion in self._suggestions:
-                # Calculate fuzzy match score
-                score = fuzz.partial_ratio(query, suggestion.lower())
-
-                # Only include if score meets threshold
-                if score >= self.MATCH_THRESHOLD:
-                    scored_suggestions.append((score, suggestion))
-
-            # Sort by score (descending) and take top N
-            scored_suggestions.sort(reverse=True, key=lambda x: x[0])
-            filtered = [s for _, s in scored_suggestions[: self.MAX_SUGGESTIONS]]
+            # WHY process.extractBests: Scores all choices in one call to the
+            # compiled rapidfuzz backend instead of a Python loop calling
+            # partial_ratio() per suggestion. Results come back sorted by
+            # score, limited to the top N, as (choice, score, index) tuples.
+            # WHY threshold - 0.5: Raw scores are floats that are rounded to
+            # ints afterwards, so e.g. 59.6 counts as a score of 60
+            matches = process.extractBests(
+                query,
+                self._choices,
+                processor=None,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=self.MATCH_THRESHOLD - 0.5,
+                limit=self.MAX_SUGGESTIONS,
+            )
+            filtered = [self._suggestions[index] for _, _, index in matches]
 
         else:
             # Fallback: simple substring matching
-            filtered = [s for s in self._suggestions if query in s.lower()][
-                : self.MAX_SUGGESTIONS
-            ]
+            filtered = [
+                self._suggestions[index]
+                for index, folded in self._choices.items()
+                if query in folded
+            ][: self.MAX_SUGGESTIONS]
+
+        # Remember the result, evicting the oldest entry when full
+        # WHY next(iter()): Dicts keep insertion order, so the first key is
+        # the oldest cached query
+        if len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+            del self._result_cache[next(iter(self._result_cache))]
+        self._result_cache[query] = filtered
 
         return filtered
 
@@ -373,7 +408,19 @@ class Autocomplete(QWidget):
         Example:
             autocomplete.set_suggestions(["Botox", "Filler", "Microneedling"])
         """
-        self._suggestions = items
+        # Rebuild the shared prepared list only if the items changed
+        items_key = tuple(items)
+        if items_key != Autocomplete._shared_suggestions:
+            Autocomplete._shared_suggestions = items_key
+            Autocomplete._shared_choices = {
+                index: item.casefold() for index, item in enumerate(items_key)
+            }
+
+        self._suggestions = Autocomplete._shared_suggestions
+        self._choices = Autocomplete._shared_choices
+
+        # Cached results belong to the previous suggestions
+        self._result_cache.clear()
         logger.debug(f"Autocomplete suggestions set: {len(items)} items")
 
     def get_text(self) -> str:
@@ -10,6 +10,7 @@
 #   - Date validation
 #   - Signal emission on date change
 #   - Localized date formatting
+#   - Calendar popup built in the background once the picker is shown
 #
 # Design Philosophy:
 #   - Shows formatted date in input (e.g., "Dec 15, 2023")
@@ -27,7 +28,8 @@ import logging
 from datetime import date
 from typing import Optional
 
-from PyQt6.QtCore import QDate, Qt, pyqtSignal
+from PyQt6.QtCore import QDate, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QShowEvent
 
 from cosmetics_records.utils.time_utils import format_date_localized
 from PyQt6.QtWidgets import (
@@ -203,6 +205,34 @@ class DatePicker(QWidget):
         self._calendar_btn.clicked.connect(self._show_calendar)
         layout.addWidget(self._calendar_btn)
 
+    def showEvent(self, event: Optional[QShowEvent]) -> None:
+        """
+        Handle show events to preload the calendar popup.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        # Build the popup on the next event loop iteration
+        # WHY defer: QCalendarWidget is the heaviest widget in most forms.
+        # Building it after the dialog is visible keeps dialog opening fast,
+        # while the popup is still ready by the time the user clicks.
+        if self._popup is None:
+            QTimer.singleShot(0, self._ensure_popup)
+
+    def _ensure_popup(self) -> CalendarPopup:
+        """
+        Create the calendar popup if it doesn't exist yet.
+
+        Returns:
+            CalendarPopup: The (possibly newly created) popup
+        """
+        if self._popup is None:
+            self._popup = CalendarPopup(self)
+            self._popup.date_selected.connect(self._on_date_selected)
+            logger.debug("Calendar popup created")
+        return self._popup
+
     def _show_calendar(self) -> None:
         """
         Show the calendar popup.
@@ -210,25 +240,23 @@ class DatePicker(QWidget):
         Creates the popup if it doesn't exist, positions it below the widget,
         and shows it.
         """
-        # Create popup if it doesn't exist
-        if self._popup is None:
-            self._popup = CalendarPopup(self)
-            self._popup.date_selected.connect(self._on_date_selected)
+        # Create popup if it hasn't been preloaded yet
+        popup = self._ensure_popup()
 
         # Set current date in calendar
         if self._current_date:
-            self._popup.set_selected_date(self._current_date)
+            popup.set_selected_date(self._current_date)
         else:
             # Default to today if no date selected
-            self._popup.set_selected_date(date.today())
+            popup.set_selected_date(date.today())
 
         # Position popup below this widget
         # WHY mapToGlobal: Converts widget-local coordinates to screen coordinates
         global_pos = self.mapToGlobal(self.rect().bottomLeft())
-        self._popup.move(global_pos)
+        popup.move(global_pos)
 
         # Show popup
-        self._popup.show()
+        popup.show()
 
         logger.debug("Calendar popup shown")
 
@@ -25,12 +25,11 @@
 # =============================================================================
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QFormLayout,
-    QLabel,
     QLineEdit,
     QTextEdit,
     QVBoxLayout,
@@ -67,6 +66,28 @@ class AddClientDialog(BaseDialog):
         _error_label: QLabel for displaying validation errors
     """
 
+    @classmethod
+    def _get_labels(cls) -> Dict[str, str]:
+        """
+        Get the translated form row labels for the current locale.
+
+        Returns:
+            dict: Mapping of field name to its label text (with ":" suffix
+                  and "*" marker for required fields)
+        """
+        return cls._cached_texts(
+            lambda: {
+                "first_name": _("First Name") + ": *",
+                "last_name": _("Last Name") + ": *",
+                "email": _("Email") + ":",
+                "phone": _("Phone") + ":",
+                "address": _("Address") + ":",
+                "date_of_birth": _("Date of Birth") + ":",
+                "allergies": _("Allergies") + ":",
+                "tags": _("Tags") + ":",
+            }
+        )
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the add client dialog.
@@ -98,50 +119,59 @@ class AddClientDialog(BaseDialog):
         # WHY use BaseDialog method: Ensures consistent styling across all dialogs
         self.create_error_label(layout)
 
-        # Form layout for fields
-        form_layout = QFormLayout()
-        form_layout.setSpacing(12)
-        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-
         # First Name (required)
         self._first_name_input = QLineEdit()
         self._first_name_input.setPlaceholderText(_("Enter first name..."))
-        form_layout.addRow(_("First Name") + ": *", self._first_name_input)
 
         # Last Name (required)
         self._last_name_input = QLineEdit()
         self._last_name_input.setPlaceholderText(_("Enter last name..."))
-        form_layout.addRow(_("Last Name") + ": *", self._last_name_input)
 
         # Email (optional)
         self._email_input = QLineEdit()
         self._email_input.setPlaceholderText(_("Enter email address..."))
-        form_layout.addRow(_("Email") + ":", self._email_input)
 
         # Phone (optional)
         self._phone_input = QLineEdit()
         self._phone_input.setPlaceholderText(_("Enter phone number..."))
-        form_layout.addRow(_("Phone") + ":", self._phone_input)
 
         # Address (optional)
         self._address_input = QTextEdit()
         self._address_input.setPlaceholderText(_("Enter address..."))
         self._address_input.setFixedHeight(ComponentHeight.TEXTAREA_MEDIUM)
-        form_layout.addRow(_("Address") + ":", self._address_input)
 
         # Date of Birth (optional)
         self._dob_picker = DatePicker()
-        form_layout.addRow(_("Date of Birth") + ":", self._dob_picker)
 
         # Allergies (optional)
         self._allergies_input = QTextEdit()
         self._allergies_input.setPlaceholderText(_("Enter any allergies..."))
         self._allergies_input.setFixedHeight(ComponentHeight.TEXTAREA_SMALL)
-        form_layout.addRow(_("Allergies") + ":", self._allergies_input)
 
         # Tags (optional)
         self._tag_input = TagInput()
-        form_layout.addRow(_("Tags") + ":", self._tag_input)
+
+        # Form layout for fields
+        # WHY build rows first: All widgets are fully configured before they
+        # are added, and the form is only attached to the dialog layout once
+        # every row is in place, so geometry is computed a single time
+        rows = [
+            ("first_name", self._first_name_input),
+            ("last_name", self._last_name_input),
+            ("email", self._email_input),
+            ("phone", self._phone_input),
+            ("address", self._address_input),
+            ("date_of_birth", self._dob_picker),
+            ("allergies", self._allergies_input),
+            ("tags", self._tag_input),
+        ]
+        labels = self._get_labels()
+
+        form_layout = QFormLayout()
+        form_layout.setSpacing(12)
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        for field, widget in rows:
+            form_layout.addRow(labels[field], widget)
 
         layout.addLayout(form_layout)
 
@@ -149,9 +179,7 @@ class AddClientDialog(BaseDialog):
         layout.addStretch()
 
         # Required fields note
-        required_note = QLabel(_("* Required fields"))
-        required_note.setProperty("form_note", True)  # CSS class (small, gray)
-        layout.addWidget(required_note)
+        self.create_form_note(layout, _("* Required fields"))
 
         # Save/Cancel buttons
         button_row = self.create_button_row(_("Save"), _("Cancel"))
@@ -192,7 +220,7 @@ class AddClientDialog(BaseDialog):
             return
 
         # Validation passed
-        logger.debug(f"Adding new client: {first_name} {last_name}")
+        logger.debug("Adding new client: %s %s", first_name, last_name)
 
         # Hide error if it was showing
         self.hide_error()
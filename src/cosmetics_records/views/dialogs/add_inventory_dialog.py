@@ -31,7 +31,6 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QFormLayout,
     QHBoxLayout,
-    QLabel,
     QLineEdit,
     QSpinBox,
     QTextEdit,
@@ -40,6 +39,7 @@ from PyQt6.QtWidgets import (
 )
 
 from .base_dialog import BaseDialog
+from ..constants import ComponentHeight
 from cosmetics_records.config import Config
 from cosmetics_records.utils.localization import _
 
@@ -47,8 +47,9 @@ from cosmetics_records.utils.localization import _
 logger = logging.getLogger(__name__)
 
 # Unit options by measurement system
-METRIC_UNITS = ["ml", "g"]
-IMPERIAL_UNITS = ["fl oz", "oz"]
+# WHY tuples: Shared by every dialog, so they must not be modified in place
+METRIC_UNITS = ("ml", "g")
+IMPERIAL_UNITS = ("fl oz", "oz")
 
 
 def get_units_for_system() -> list:
@@ -60,9 +61,9 @@ def get_units_for_system() -> list:
     """
     config = Config.get_instance()
     if config.units_system == "imperial":
-        base_units = IMPERIAL_UNITS.copy()
+        base_units = list(IMPERIAL_UNITS)
     else:
-        base_units = METRIC_UNITS.copy()
+        base_units = list(METRIC_UNITS)
 
     # Add localized "Pc." (pieces) which is the same in both systems
     base_units.append(_("Pc."))
@@ -122,7 +123,7 @@ class AddInventoryDialog(BaseDialog):
         # Description (optional)
         self._description_input = QTextEdit()
         self._description_input.setPlaceholderText(_("Enter description..."))
-        self._description_input.setFixedHeight(80)
+        self._description_input.setFixedHeight(ComponentHeight.TEXTAREA_MEDIUM)
         form_layout.addRow(_("Description") + ":", self._description_input)
 
         # Capacity and Unit on same row: [Capacity input] [Unit dropdown]
@@ -153,9 +154,7 @@ class AddInventoryDialog(BaseDialog):
         layout.addStretch()
 
         # Required fields note
-        required_note = QLabel(_("* Required fields"))
-        required_note.setProperty("form_note", True)  # CSS class (small, gray)
-        layout.addWidget(required_note)
+        self.create_form_note(layout, _("* Required fields"))
 
         # Save/Cancel buttons
         button_row = self.create_button_row("Save", "Cancel")
@@ -183,7 +182,7 @@ class AddInventoryDialog(BaseDialog):
             return
 
         # Validation passed
-        logger.debug(f"Adding new inventory item: {name}")
+        logger.debug("Adding new inventory item: %s", name)
 
         # Hide error if it was showing
         self.hide_error()
@@ -28,13 +28,14 @@ import logging
 from datetime import date
 from typing import Callable, List, Optional
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QComboBox,
     QFormLayout,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -47,6 +48,10 @@ from cosmetics_records.utils.localization import _
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Quantity selector options (1x-10x)
+# WHY module level: Formatted once at import instead of on every dialog open
+QUANTITY_OPTIONS = tuple(f"{i}x" for i in range(1, 11))
+
 
 class AddProductRecordDialog(BaseDialog):
     """
@@ -62,11 +67,20 @@ class AddProductRecordDialog(BaseDialog):
         _date_picker: DatePicker for selecting record date
         _product_input: Autocomplete for product text
         _quantity_combo: ComboBox for quantity selection
-        _products_text: QTextEdit showing accumulated products
+        _products_text: QPlainTextEdit showing accumulated products
         _check_date_exists: Callback to check if entry exists for date
         _existing_record_id: If set, edit existing record instead
+        _pending_lines: Added products not yet written to _products_text
+        _flush_timer: QTimer that writes pending products in one update
+        _pending_text: Existing record text not yet written to _products_text
+        _result: Record data captured when the dialog was accepted
     """
 
+    # Delay before added products are written to the products text area
+    # WHY 50ms: Short enough to feel instant, long enough to coalesce rapid
+    # additions into a single text update instead of one per product
+    PRODUCT_FLUSH_DELAY = 50
+
     def __init__(
         self,
         client_id: int,
@@ -88,6 +102,7 @@ class AddProductRecordDialog(BaseDialog):
         self._inventory_items = inventory_items or []
         self._check_date_exists = check_date_exists
         self._existing_record_id: Optional[int] = None
+        self._result: Optional[dict] = None
 
         # Initialize base dialog - larger to fit suggestions
         super().__init__(_("Add Product Record"), parent, width=550, height=500)
@@ -96,7 +111,7 @@ class AddProductRecordDialog(BaseDialog):
         if self._inventory_items:
             self._product_input.set_suggestions(self._inventory_items)
 
-        logger.debug(f"AddProductRecordDialog initialized for client {client_id}")
+        logger.debug("AddProductRecordDialog initialized for client %s", client_id)
 
     def _create_content(self, layout: QVBoxLayout) -> None:
         """
@@ -129,8 +144,7 @@ class AddProductRecordDialog(BaseDialog):
 
         # Quantity selector (1x-10x)
         self._quantity_combo = QComboBox()
-        for i in range(1, 11):
-            self._quantity_combo.addItem(f"{i}x")
+        self._quantity_combo.addItems(QUANTITY_OPTIONS)
         self._quantity_combo.setFixedWidth(70)
         # CSS property for compact styling
         self._quantity_combo.setProperty("quantity_selector", True)
@@ -150,21 +164,31 @@ class AddProductRecordDialog(BaseDialog):
         layout.addLayout(entry_row)
 
         # Info note about free text (smaller, subtle hint)
-        info_note = QLabel(_("Type to search inventory, or enter custom product name"))
-        info_note.setProperty("form_note", True)
-        info_note.setWordWrap(True)
-        info_note.setStyleSheet("color: #666; font-size: 11px;")
-        layout.addWidget(info_note)
+        self.create_form_note(
+            layout, _("Type to search inventory, or enter custom product name")
+        )
 
         # Accumulated products text area
         products_label = QLabel(_("Products:"))
         layout.addWidget(products_label)
 
-        self._products_text = QTextEdit()
+        # WHY QPlainTextEdit: The list is plain text that only grows line by
+        # line, so the lighter plain text document is enough (no rich text)
+        self._products_text = QPlainTextEdit()
         self._products_text.setPlaceholderText(_("Added products will appear here..."))
         self._products_text.setMinimumHeight(150)
         layout.addWidget(self._products_text)
 
+        # Products added since the last text update
+        # WHY setSingleShot(True): Restarted on each add, so a burst of adds
+        # results in a single update once it settles
+        self._pending_lines: List[str] = []
+        self._pending_text: Optional[str] = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.PRODUCT_FLUSH_DELAY)
+        self._flush_timer.timeout.connect(self._flush_pending_products)
+
         # Save/Cancel buttons
         button_row = self.create_button_row(_("Save"), _("Cancel"))
         layout.addLayout(button_row)
@@ -184,14 +208,10 @@ class AddProductRecordDialog(BaseDialog):
         # Get quantity
         quantity = self._quantity_combo.currentText()
 
-        # Add to products text
-        current_text = self._products_text.toPlainText()
+        # Queue for the products text (written once the burst settles)
         new_line = f"{quantity} {product_name}"
-
-        if current_text:
-            self._products_text.setPlainText(f"{current_text}\n{new_line}")
-        else:
-            self._products_text.setPlainText(new_line)
+        self._pending_lines.append(new_line)
+        self._flush_timer.start()
 
         # Clear input for next product
         self._product_input.clear()
@@ -201,7 +221,37 @@ class AddProductRecordDialog(BaseDialog):
         # Hide error if showing
         self.hide_error()
 
-        logger.debug(f"Added product: {new_line}")
+        logger.debug("Added product: %s", new_line)
+
+    def _flush_pending_products(self) -> None:
+        """
+        Write all queued products to the products text area in one update.
+
+        Also called directly before the text is read, so callers always see
+        every product that has been added. A pending existing record text is
+        written first, so added products end up after it.
+        """
+        self._flush_timer.stop()
+
+        if self._pending_text is not None:
+            product_text = self._pending_text
+            self._pending_text = None
+            # Only replace the text if it differs
+            # WHY: setPlainText() rebuilds the whole document and clears the
+            # undo history, which is wasted work when the text is unchanged
+            if self._products_text.toPlainText() != product_text:
+                self._products_text.setPlainText(product_text)
+
+        if not self._pending_lines:
+            return
+
+        new_text = "\n".join(self._pending_lines)
+        self._pending_lines.clear()
+
+        # Append after the existing text instead of re-setting all of it
+        # WHY appendPlainText: Only the new lines are laid out, the existing
+        # text is left untouched, and the text is never treated as HTML
+        self._products_text.appendPlainText(new_text)
 
     def accept(self) -> None:
         """
@@ -226,6 +276,7 @@ class AddProductRecordDialog(BaseDialog):
             return
 
         # Check if there's content in the products text
+        self._flush_pending_products()
         products_text = self._products_text.toPlainText().strip()
 
         # Also check if there's something in the input field that wasn't added
@@ -233,6 +284,7 @@ class AddProductRecordDialog(BaseDialog):
         if pending_product and not products_text:
             # Auto-add the pending product
             self._on_add_product()
+            self._flush_pending_products()
             products_text = self._products_text.toPlainText().strip()
 
         if not products_text:
@@ -242,12 +294,21 @@ class AddProductRecordDialog(BaseDialog):
 
         # Validation passed
         logger.debug(
-            f"Adding product record for client {self._client_id} on {selected_date}"
+            "Adding product record for client %s on %s", self._client_id, selected_date
         )
 
         # Hide error if it was showing
         self.hide_error()
 
+        # Capture the result once, the inputs don't change after accepting
+        # WHY: Callers may fetch the data several times (logging, retries),
+        # which shouldn't re-serialize the products document each time
+        self._result = {
+            "client_id": self._client_id,
+            "date": selected_date,
+            "product_text": products_text,
+        }
+
         # Accept dialog
         super().accept()
 
@@ -263,10 +324,22 @@ class AddProductRecordDialog(BaseDialog):
             product_text: Existing product text to pre-fill
         """
         self._existing_record_id = record_id
+        self._result = None
         self._date_picker.set_date(record_date)
-        self._products_text.setPlainText(product_text)
-        self.setWindowTitle(_("Edit Product Record"))
-        logger.debug(f"Editing existing product record {record_id}")
+        self._pending_lines.clear()
+        self._flush_timer.stop()
+
+        # Write the existing text on the next event loop iteration
+        # WHY defer: Laying out a long product list would otherwise block
+        # before the dialog is first painted. Reads flush it first, so it is
+        # never missed.
+        self._pending_text = product_text
+        QTimer.singleShot(0, self._flush_pending_products)
+
+        title = _("Edit Product Record")
+        if self.windowTitle() != title:
+            self.setWindowTitle(title)
+        logger.debug("Editing existing product record %s", record_id)
 
     def is_editing_existing(self) -> bool:
         """
@@ -297,8 +370,14 @@ class AddProductRecordDialog(BaseDialog):
                  - product_text: str (all added products)
 
         Note:
-            This should only be called after the dialog is accepted.
+            This should only be called after the dialog is accepted. The data
+            captured on accept is returned; before that it is read from the
+            widgets.
         """
+        if self._result is not None:
+            return self._result
+
+        self._flush_pending_products()
         return {
             "client_id": self._client_id,
             "date": self._date_picker.get_date(),
@@ -23,12 +23,12 @@
 
 import logging
 from datetime import date
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QFormLayout,
     QLabel,
-    QTextEdit,
+    QPlainTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -51,11 +51,30 @@ class AddTreatmentDialog(BaseDialog):
     Attributes:
         _client_id: Database ID of the client this treatment is for
         _date_picker: DatePicker for selecting treatment date
-        _notes_input: QTextEdit for treatment notes
+        _notes_input: QPlainTextEdit for treatment notes
         _check_date_exists: Callback to check if entry exists for date
         _existing_treatment_id: If set, edit existing treatment instead
+        _last_date_check: Last (date, exists) result of _check_date_exists
     """
 
+    @classmethod
+    def _get_texts(cls) -> Dict[str, str]:
+        """
+        Get the translated form texts for the current locale.
+
+        Returns:
+            dict: Mapping of text key to its translated text
+        """
+        return cls._cached_texts(
+            lambda: {
+                "date": _("Date") + ": *",
+                "notes": _("Notes: *"),
+                "notes_placeholder": _("Enter treatment notes..."),
+                "save": _("Save"),
+                "cancel": _("Cancel"),
+            }
+        )
+
     def __init__(
         self,
         client_id: int,
@@ -74,11 +93,12 @@ class AddTreatmentDialog(BaseDialog):
         self._client_id = client_id
         self._check_date_exists = check_date_exists
         self._existing_treatment_id: Optional[int] = None
+        self._last_date_check: Optional[Tuple[date, bool]] = None
 
         # Initialize base dialog
         super().__init__(_("Add Treatment"), parent, width=500, height=400)
 
-        logger.debug(f"AddTreatmentDialog initialized for client {client_id}")
+        logger.debug("AddTreatmentDialog initialized for client %s", client_id)
 
     def _create_content(self, layout: QVBoxLayout) -> None:
         """
@@ -93,6 +113,8 @@ class AddTreatmentDialog(BaseDialog):
         # WHY use BaseDialog method: Ensures consistent styling across all dialogs
         self.create_error_label(layout)
 
+        texts = self._get_texts()
+
         # Form layout for date
         form_layout = QFormLayout()
         form_layout.setSpacing(10)
@@ -100,16 +122,19 @@ class AddTreatmentDialog(BaseDialog):
         # Date picker (defaults to today)
         self._date_picker = DatePicker()
         self._date_picker.set_date(date.today())
-        form_layout.addRow(_("Date") + ": *", self._date_picker)
+        self._date_picker.date_changed.connect(self._on_date_changed)
+        form_layout.addRow(texts["date"], self._date_picker)
 
         layout.addLayout(form_layout)
 
         # Notes (required)
-        notes_label = QLabel(_("Notes: *"))
+        notes_label = QLabel(texts["notes"])
         layout.addWidget(notes_label)
 
-        self._notes_input = QTextEdit()
-        self._notes_input.setPlaceholderText(_("Enter treatment notes..."))
+        # WHY QPlainTextEdit: Notes are stored as plain text, so the rich text
+        # document of QTextEdit is unnecessary overhead while typing
+        self._notes_input = QPlainTextEdit()
+        self._notes_input.setPlaceholderText(texts["notes_placeholder"])
         self._notes_input.setMinimumHeight(150)
         layout.addWidget(self._notes_input)
 
@@ -117,7 +142,7 @@ class AddTreatmentDialog(BaseDialog):
         layout.addStretch()
 
         # Save/Cancel buttons
-        button_row = self.create_button_row(_("Save"), _("Cancel"))
+        button_row = self.create_button_row(texts["save"], texts["cancel"])
         layout.addLayout(button_row)
 
     def accept(self) -> None:
@@ -134,11 +159,7 @@ class AddTreatmentDialog(BaseDialog):
             return
 
         # Check for duplicate entry (only for new entries, not edits)
-        if (
-            self._check_date_exists
-            and not self._existing_treatment_id
-            and self._check_date_exists(selected_date)
-        ):
+        if not self._existing_treatment_id and self._date_exists(selected_date):
             self.show_error(_("A treatment entry already exists for this date."))
             return
 
@@ -151,7 +172,7 @@ class AddTreatmentDialog(BaseDialog):
 
         # Validation passed
         logger.debug(
-            f"Adding treatment for client {self._client_id} on {selected_date}"
+            "Adding treatment for client %s on %s", self._client_id, selected_date
         )
 
         # Hide error if it was showing
@@ -160,6 +181,39 @@ class AddTreatmentDialog(BaseDialog):
         # Accept dialog
         super().accept()
 
+    def _date_exists(self, selected_date: date) -> bool:
+        """
+        Check whether a treatment already exists for the given date.
+
+        Reuses the last result while the date is unchanged.
+
+        Args:
+            selected_date: Date to check
+
+        Returns:
+            bool: True if a treatment already exists for the date, False if
+                  not or if no check callback was given
+        """
+        if not self._check_date_exists:
+            return False
+
+        # WHY cache: The callback queries the database. After a failed save
+        # the user often fixes another field and clicks Save again with the
+        # same date, which doesn't need another query.
+        if self._last_date_check is None or self._last_date_check[0] != selected_date:
+            exists = self._check_date_exists(selected_date)
+            self._last_date_check = (selected_date, exists)
+        return self._last_date_check[1]
+
+    def _on_date_changed(self, _selected_date: date) -> None:
+        """
+        Forget the cached duplicate check when the date is changed.
+
+        Args:
+            _selected_date: The newly selected date (unused)
+        """
+        self._last_date_check = None
+
     def set_existing_treatment(
         self, treatment_id: int, treatment_date: date, notes: str
     ) -> None:
@@ -172,10 +226,11 @@ class AddTreatmentDialog(BaseDialog):
             notes: Existing notes to pre-fill
         """
         self._existing_treatment_id = treatment_id
+        self._last_date_check = None
         self._date_picker.set_date(treatment_date)
         self._notes_input.setPlainText(notes)
         self.setWindowTitle(_("Edit Treatment"))
-        logger.debug(f"Editing existing treatment {treatment_id}")
+        logger.debug("Editing existing treatment %s", treatment_id)
 
     def is_editing_existing(self) -> bool:
         """
@@ -31,17 +31,25 @@
 # =============================================================================
 
 import logging
-from typing import Optional
-
-from PyQt6.QtCore import Qt
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QHeaderView,
     QLabel,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -55,6 +63,228 @@ from .base_dialog import BaseDialog
 logger = logging.getLogger(__name__)
 
 
+def _format_size(size_bytes: int) -> str:
+    """
+    Format file size in human-readable form.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Human-readable size string (e.g., "1.2 MB")
+    """
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    else:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+
+
+class BackupTableModel(QAbstractTableModel):
+    """
+    Table model listing backups by filename, date, and size.
+
+    The view asks the model for cell text only for the rows it draws, so no
+    per-cell item objects are created when the list is loaded. Rows are
+    exposed in pages: the view fetches the next page when it is scrolled
+    to the end.
+
+    Attributes:
+        _backups: Backup info dicts as returned by BackupService.get_backups()
+        _columns: Display text per column, one entry per loaded backup
+        _headers: Translated column headers
+    """
+
+    # Number of rows exposed to the view per fetch
+    # WHY 200: Far more than fit on screen, so typical backup lists load in
+    # one page, while very long lists don't format every row up front
+    PAGE_SIZE = 200
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize the backup table model.
+
+        Args:
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self._backups: List[dict] = []
+        self._columns: Tuple[List[str], ...] = ([], [], [])
+        self._headers = [_("Filename"), _("Date"), _("Size")]
+
+    def set_backups(self, backups: List[dict]) -> None:
+        """
+        Replace the listed backups.
+
+        Args:
+            backups: Backup info dicts as returned by BackupService.get_backups()
+        """
+        self.beginResetModel()
+        self._backups = backups
+        self._columns = ([], [], [])
+        self._load_rows(self.PAGE_SIZE)
+        self.endResetModel()
+
+    def _load_rows(self, count: int) -> None:
+        """
+        Format the display text for the next rows.
+
+        Args:
+            count: Maximum number of rows to add
+        """
+        start = len(self._columns[0])
+        page = self._backups[start : start + count]
+
+        # Format every cell once when it is loaded, not on each repaint
+        # WHY: data() is called for every visible cell whenever the table is
+        # painted or scrolled, so it should only index into prepared text
+        self._columns[0].extend(backup["filename"] for backup in page)
+        self._columns[1].extend(
+            backup["created"].strftime("%Y-%m-%d %H:%M") for backup in page
+        )
+        self._columns[2].extend(_format_size(backup["size"]) for backup in page)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Return True if there are backups not yet shown in the view."""
+        if parent.isValid():
+            return False
+        return len(self._columns[0]) < len(self._backups)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """
+        Show the next page of backups.
+
+        Args:
+            parent: Parent index (always invalid for a table model)
+        """
+        if parent.isValid():
+            return
+
+        start = len(self._columns[0])
+        count = min(self.PAGE_SIZE, len(self._backups) - start)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self._load_rows(count)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        """
+        Remove a single loaded backup row.
+
+        Args:
+            row: Row index to remove
+        """
+        if not 0 <= row < len(self._columns[0]):
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._backups[row]
+        for column in self._columns:
+            del column[row]
+        self.endRemoveRows()
+
+    def backup_at(self, row: int) -> Optional[dict]:
+        """
+        Get the backup info shown in a row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Optional[dict]: Backup info dict, or None if the row doesn't exist
+        """
+        if 0 <= row < len(self._columns[0]):
+            return self._backups[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of loaded backups (table models have no children)."""
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Return the data for a cell.
+
+        Args:
+            index: Cell index
+            role: Requested data role
+
+        Returns:
+            Display text for DisplayRole, the backup dict for UserRole,
+            None otherwise
+        """
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._backups[index.row()]
+
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Return the column header text."""
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self._headers)
+        ):
+            return self._headers[section]
+        return None
+
+
+class VerifySignals(QObject):
+    """
+    Signals emitted by a VerifyTask.
+
+    Signals:
+        finished(str, bool, str): Emitted with the backup path, whether the
+                                  backup is valid, and the result message
+    """
+
+    finished = pyqtSignal(str, bool, str)
+
+
+class VerifyTask(QRunnable):
+    """
+    Background task that verifies a backup file.
+
+    Attributes:
+        signals: VerifySignals used to report the result
+    """
+
+    def __init__(self, backup_service: BackupService, backup_path: str):
+        """
+        Initialize the verify task.
+
+        Args:
+            backup_service: Service used to verify the backup
+            backup_path: Path to the backup file to verify
+        """
+        super().__init__()
+        self._backup_service = backup_service
+        self._backup_path = backup_path
+        self.signals = VerifySignals()
+
+    def run(self) -> None:
+        """Verify the backup and emit the result."""
+        is_valid, message = self._backup_service.verify_backup(self._backup_path)
+        self.signals.finished.emit(self._backup_path, is_valid, message)
+
+
 class BackupManagementDialog(BaseDialog):
     """
     Dialog for managing database backups.
@@ -69,8 +299,27 @@ class BackupManagementDialog(BaseDialog):
         _config: Application configuration instance
         _backup_service: Service for backup operations
         _selected_backup: Currently selected backup info dict
+        _verify_task: Verification running in the background, if any
     """
 
+    @classmethod
+    def _get_texts(cls) -> Dict[str, str]:
+        """
+        Get the translated status texts for the current locale.
+
+        Returns:
+            dict: Mapping of text key to its translated text
+        """
+        return cls._cached_texts(
+            lambda: {
+                "no_selection": _("No backup selected"),
+                "selected": _("Selected:"),
+                "status": _("Status:"),
+                "verifying": _("Verifying..."),
+                "valid": _("Valid"),
+            }
+        )
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the backup management dialog.
@@ -86,6 +335,7 @@ class BackupManagementDialog(BaseDialog):
         db_path = config_dir / "cosmetics_records.db"
         self._backup_service = BackupService(str(db_path), str(backup_dir))
         self._selected_backup: Optional[dict] = None
+        self._verify_task: Optional[VerifyTask] = None
 
         super().__init__(
             title=_("Manage Backups"),
@@ -112,8 +362,10 @@ class BackupManagementDialog(BaseDialog):
         # Button row
         self._create_buttons(layout)
 
-        # Load backups
-        self._refresh_backup_list()
+        # Load backups on the next event loop iteration
+        # WHY defer: Listing the backup directory is disk I/O. Scheduling it
+        # lets the (still empty) dialog appear first instead of waiting for it
+        QTimer.singleShot(0, self._refresh_backup_list)
 
     def _create_backup_table(self, layout: QVBoxLayout) -> None:
         """
@@ -122,20 +374,16 @@ class BackupManagementDialog(BaseDialog):
         Args:
             layout: Parent layout
         """
-        self._table = QTableWidget()
-        self._table.setColumnCount(3)
-        self._table.setHorizontalHeaderLabels(
-            [
-                _("Filename"),
-                _("Date"),
-                _("Size"),
-            ]
-        )
+        # WHY QTableView + model: Cells are drawn straight from the backup
+        # dicts instead of allocating three QTableWidgetItems per backup
+        self._model = BackupTableModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
 
         # Configure table
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self._table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self._table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self._table.verticalHeader().setVisible(False)
 
         # Column sizing
@@ -143,9 +391,16 @@ class BackupManagementDialog(BaseDialog):
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        # Size the columns from the visible rows only
+        # WHY: By default up to 1000 rows are measured after every reset or
+        # fetched page. Date and size texts all have about the same width,
+        # so the visible rows are enough.
+        header.setResizeContentsPrecision(0)
 
         # Connect selection
-        self._table.itemSelectionChanged.connect(self._on_selection_changed)
+        self._table.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
+        )
 
         layout.addWidget(self._table)
 
@@ -156,14 +411,34 @@ class BackupManagementDialog(BaseDialog):
         Args:
             layout: Parent layout
         """
-        self._selection_label = QLabel(_("No backup selected"))
-        self._selection_label.setStyleSheet("color: #888888;")
+        self._selection_label = QLabel(self._get_texts()["no_selection"])
+        self._selection_label.setProperty("status_state", "muted")  # CSS class
         layout.addWidget(self._selection_label)
 
         self._status_label = QLabel("")
-        self._status_label.setStyleSheet("color: #888888;")
+        self._status_label.setProperty("status_state", "muted")  # CSS class
         layout.addWidget(self._status_label)
 
+    def _set_status(self, text: str, state: str = "muted") -> None:
+        """
+        Show a status message.
+
+        Args:
+            text: Status text to show
+            state: Style state: "muted", "ok", or "error"
+        """
+        self._status_label.setText(text)
+
+        # Switch the theme rule only when the state actually changes
+        # WHY property + re-polish: The colors come from the theme stylesheet,
+        # so no per-widget stylesheet has to be parsed on every status update
+        if self._status_label.property("status_state") != state:
+            self._status_label.setProperty("status_state", state)
+            style = self._status_label.style()
+            if style:
+                style.unpolish(self._status_label)
+                style.polish(self._status_label)
+
     def _create_buttons(self, layout: QVBoxLayout) -> None:
         """
         Create the button row.
@@ -211,68 +486,38 @@ class BackupManagementDialog(BaseDialog):
     def _refresh_backup_list(self) -> None:
         """Refresh the backup list from disk."""
         backups = self._backup_service.get_backups()
+        self._model.set_backups(backups)
+        self._reset_selection_state()
 
-        self._table.setRowCount(len(backups))
-
-        for row, backup in enumerate(backups):
-            # Filename
-            filename_item = QTableWidgetItem(backup["filename"])
-            filename_item.setData(Qt.ItemDataRole.UserRole, backup)
-            self._table.setItem(row, 0, filename_item)
-
-            # Date
-            date_str = backup["created"].strftime("%Y-%m-%d %H:%M")
-            self._table.setItem(row, 1, QTableWidgetItem(date_str))
-
-            # Size
-            size_str = self._format_size(backup["size"])
-            self._table.setItem(row, 2, QTableWidgetItem(size_str))
-
-        # Reset selection state
+    def _reset_selection_state(self) -> None:
+        """Clear the selected backup and its labels."""
         self._selected_backup = None
         self._update_buttons()
-        self._selection_label.setText(_("No backup selected"))
-        self._status_label.setText("")
-
-    def _format_size(self, size_bytes: int) -> str:
-        """
-        Format file size in human-readable form.
-
-        Args:
-            size_bytes: Size in bytes
-
-        Returns:
-            Human-readable size string (e.g., "1.2 MB")
-        """
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
+        self._selection_label.setText(self._get_texts()["no_selection"])
+        self._set_status("")
 
     def _on_selection_changed(self) -> None:
         """Handle table selection change."""
-        selected = self._table.selectedItems()
-        if selected:
-            row = selected[0].row()
-            item = self._table.item(row, 0)
-            self._selected_backup = item.data(Qt.ItemDataRole.UserRole)
+        selected = self._table.selectionModel().selectedRows()
+        backup = self._model.backup_at(selected[0].row()) if selected else None
+        if backup is not None:
+            self._selected_backup = backup
             self._selection_label.setText(
-                _("Selected:") + f" {self._selected_backup['filename']}"
+                f"{self._get_texts()['selected']} {backup['filename']}"
             )
-            self._status_label.setText("")
-            self._status_label.setStyleSheet("color: #888888;")
+            self._set_status("")
         else:
             self._selected_backup = None
-            self._selection_label.setText(_("No backup selected"))
-            self._status_label.setText("")
+            self._selection_label.setText(self._get_texts()["no_selection"])
+            self._set_status("")
 
         self._update_buttons()
 
     def _update_buttons(self) -> None:
         """Update button enabled states based on selection."""
-        has_selection = self._selected_backup is not None
+        # WHY also check _verify_task: The backup must not be restored or
+        # deleted while it is still being read by the verification
+        has_selection = self._selected_backup is not None and self._verify_task is None
         self._verify_btn.setEnabled(has_selection)
         self._restore_btn.setEnabled(has_selection)
         self._delete_btn.setEnabled(has_selection)
@@ -284,41 +529,86 @@ class BackupManagementDialog(BaseDialog):
 
         logger.info(f"Verifying backup: {self._selected_backup['filename']}")
 
-        is_valid, message = self._backup_service.verify_backup(
-            self._selected_backup["path"]
-        )
+        # Run the CRC check in the background
+        # WHY: Reading and checksumming a large backup takes a while, and the
+        # dialog should stay responsive in the meantime
+        task = VerifyTask(self._backup_service, self._selected_backup["path"])
+        task.signals.finished.connect(self._on_verify_finished)
+        self._verify_task = task
+        self._update_buttons()
+
+        texts = self._get_texts()
+        self._set_status(f"{texts['status']} {texts['verifying']}")
 
+        QThreadPool.globalInstance().start(task)
+
+    def _on_verify_finished(
+        self, backup_path: str, is_valid: bool, message: str
+    ) -> None:
+        """
+        Show the result of a background verification.
+
+        Args:
+            backup_path: Path of the verified backup
+            is_valid: True if the backup passed all checks
+            message: Description of the result or error
+        """
+        self._verify_task = None
+        self._update_buttons()
+
+        # Only show the result if that backup is still the selected one
+        if not self._selected_backup or self._selected_backup["path"] != backup_path:
+            return
+
+        texts = self._get_texts()
         if is_valid:
-            self._status_label.setText(_("Status:") + f" {_('Valid')}")
-            self._status_label.setStyleSheet("color: #66ff66;")
+            self._set_status(f"{texts['status']} {texts['valid']}", "ok")
             logger.info("Backup verification passed")
         else:
-            self._status_label.setText(_("Status:") + f" {message}")
-            self._status_label.setStyleSheet("color: #ff6666;")
+            self._set_status(f"{texts['status']} {message}", "error")
             logger.warning(f"Backup verification failed: {message}")
 
+    def _confirm_action(self, title: str, question: str, detail: str) -> bool:
+        """
+        Ask the user to confirm an action on the selected backup.
+
+        The message shows the question, the selected backup's filename, and
+        the detail text. "No" is the default button.
+
+        Args:
+            title: Message box title
+            question: Question to ask
+            detail: Consequences of the action
+
+        Returns:
+            bool: True if the user clicked "Yes"
+        """
+        if not self._selected_backup:
+            return False
+
+        reply = QMessageBox.warning(
+            self,
+            title,
+            f"{question}\n\n{self._selected_backup['filename']}\n\n{detail}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        return reply == QMessageBox.StandardButton.Yes
+
     def _on_restore(self) -> None:
         """Handle Restore button click."""
         if not self._selected_backup:
             return
 
         # Confirm restore
-        reply = QMessageBox.warning(
-            self,
+        if not self._confirm_action(
             _("Confirm Restore"),
-            _("Are you sure you want to restore from this backup?")
-            + "\n\n"
-            + self._selected_backup["filename"]
-            + "\n\n"
-            + _(
+            _("Are you sure you want to restore from this backup?"),
+            _(
                 "This will replace the current database. "
                 "A pre-restore backup will be created automatically."
             ),
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
-        )
-
-        if reply != QMessageBox.StandardButton.Yes:
+        ):
             return
 
         logger.info(f"Restoring backup: {self._selected_backup['filename']}")
@@ -350,19 +640,11 @@ class BackupManagementDialog(BaseDialog):
             return
 
         # Confirm delete
-        reply = QMessageBox.warning(
-            self,
+        if not self._confirm_action(
             _("Confirm Delete"),
-            _("Are you sure you want to delete this backup?")
-            + "\n\n"
-            + self._selected_backup["filename"]
-            + "\n\n"
-            + _("This action cannot be undone."),
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
-        )
-
-        if reply != QMessageBox.StandardButton.Yes:
+            _("Are you sure you want to delete this backup?"),
+            _("This action cannot be undone."),
+        ):
             return
 
         logger.info(f"Deleting backup: {self._selected_backup['filename']}")
@@ -371,9 +653,17 @@ class BackupManagementDialog(BaseDialog):
         success = self._backup_service.delete_backup(self._selected_backup["path"])
 
         if success:
-            self._refresh_backup_list()
-            self._status_label.setText(_("Backup deleted"))
-            self._status_label.setStyleSheet("color: #66ff66;")
+            # Drop just the deleted row instead of re-scanning the directory
+            # WHY: Nothing else in the list changed, so a full reload would
+            # only rebuild the same rows again
+            selected = self._table.selectionModel().selectedRows()
+            if selected:
+                self._model.remove_row(selected[0].row())
+                self._table.clearSelection()
+                self._reset_selection_state()
+            else:
+                self._refresh_backup_list()
+            self._set_status(_("Backup deleted"), "ok")
             logger.info("Backup deleted successfully")
         else:
             QMessageBox.critical(
@@ -29,7 +29,7 @@
 # =============================================================================
 
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PyQt6.QtGui import QKeyEvent
@@ -45,7 +45,7 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 
-from cosmetics_records.utils.localization import _
+from cosmetics_records.utils.localization import _, get_current_locale
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -64,6 +64,32 @@ class BaseDialog(QDialog):
         _content_layout: Layout where subclasses add content
     """
 
+    # Translated texts of all dialogs, by (dialog class, locale)
+    # WHY per locale: The language can be switched at runtime, so texts
+    # built for one language must not be reused for another
+    _texts_cache: Dict[Tuple[type, str], Dict[str, str]] = {}
+
+    @classmethod
+    def _cached_texts(cls, build: Callable[[], Dict[str, str]]) -> Dict[str, str]:
+        """
+        Get a dialog's translated texts for the current locale.
+
+        The texts are built on first use per dialog class and locale, and
+        shared by all instances afterwards.
+
+        Args:
+            build: Function returning the texts in the current locale
+
+        Returns:
+            dict: Mapping of text key to its translated text
+        """
+        key = (cls, get_current_locale())
+        texts = BaseDialog._texts_cache.get(key)
+        if texts is None:
+            texts = build()
+            BaseDialog._texts_cache[key] = texts
+        return texts
+
     def __init__(
         self,
         title: str,
@@ -132,7 +158,14 @@ class BaseDialog(QDialog):
         frame_layout.addLayout(self._content_layout)
 
         # Call subclass method to add specific content
-        self._create_content(self._content_layout)
+        # WHY updates disabled: Subclasses add many widgets in a row. With
+        # updates off, no intermediate repaints are scheduled while the
+        # content is built; the dialog is drawn once when it's re-enabled.
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_content(self._content_layout)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _create_title_bar(self, layout: QVBoxLayout) -> None:
         """
@@ -212,6 +245,26 @@ class BaseDialog(QDialog):
         layout.addWidget(self._error_label)
         return self._error_label
 
+    def create_form_note(self, layout: QVBoxLayout, text: str) -> QLabel:
+        """
+        Create a small gray note label (e.g. "* Required fields").
+
+        The look comes from the form_note rule in the theme stylesheet, so
+        no per-widget stylesheet has to be parsed for each note.
+
+        Args:
+            layout: Layout to add the note to
+            text: Note text to display
+
+        Returns:
+            QLabel: The created note label
+        """
+        note = QLabel(text)
+        note.setProperty("form_note", True)  # CSS class (small, gray)
+        note.setWordWrap(True)
+        layout.addWidget(note)
+        return note
+
     def show_error(self, message: str) -> None:
         """
         Show an error message in the dialog's error label.
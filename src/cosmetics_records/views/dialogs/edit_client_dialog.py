@@ -26,14 +26,13 @@
 # =============================================================================
 
 import logging
-from typing import Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QDialog,
     QFormLayout,
     QHBoxLayout,
-    QLabel,
     QLineEdit,
     QPushButton,
     QTextEdit,
@@ -41,6 +40,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from .add_client_dialog import AddClientDialog
 from .base_dialog import BaseDialog, ConfirmDialog
 from ..components.date_picker import DatePicker
 from ..components.tag_input import TagInput
@@ -63,6 +63,8 @@ class EditClientDialog(BaseDialog):
         _client_id: Database ID of the client being edited
         _client_data: Dictionary containing current client data
         _deleted: Flag indicating if client was deleted
+        _confirm_dialog: Delete confirmation, created on first use
+        _result: Client data captured when the dialog was accepted
         _first_name_input: QLineEdit for first name
         _last_name_input: QLineEdit for last name
         _email_input: QLineEdit for email
@@ -96,6 +98,8 @@ class EditClientDialog(BaseDialog):
         self._client_id = client_id
         self._client_data = client_data
         self._deleted = False
+        self._confirm_dialog: Optional[ConfirmDialog] = None
+        self._result: Optional[dict] = None
 
         # Initialize base dialog
         # WHY LARGE + extra height: Same as add dialog but with delete button row
@@ -124,50 +128,60 @@ class EditClientDialog(BaseDialog):
         # WHY use BaseDialog method: Ensures consistent styling across all dialogs
         self.create_error_label(layout)
 
-        # Form layout for fields
-        form_layout = QFormLayout()
-        form_layout.setSpacing(12)
-        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-
         # First Name (required)
         self._first_name_input = QLineEdit()
         self._first_name_input.setPlaceholderText(_("Enter first name..."))
-        form_layout.addRow(_("First Name") + ": *", self._first_name_input)
 
         # Last Name (required)
         self._last_name_input = QLineEdit()
         self._last_name_input.setPlaceholderText(_("Enter last name..."))
-        form_layout.addRow(_("Last Name") + ": *", self._last_name_input)
 
         # Email (optional)
         self._email_input = QLineEdit()
         self._email_input.setPlaceholderText(_("Enter email address..."))
-        form_layout.addRow(_("Email") + ":", self._email_input)
 
         # Phone (optional)
         self._phone_input = QLineEdit()
         self._phone_input.setPlaceholderText(_("Enter phone number..."))
-        form_layout.addRow(_("Phone") + ":", self._phone_input)
 
         # Address (optional)
         self._address_input = QTextEdit()
         self._address_input.setPlaceholderText(_("Enter address..."))
         self._address_input.setFixedHeight(ComponentHeight.TEXTAREA_MEDIUM)
-        form_layout.addRow(_("Address") + ":", self._address_input)
 
         # Date of Birth (optional)
         self._dob_picker = DatePicker()
-        form_layout.addRow(_("Date of Birth") + ":", self._dob_picker)
 
         # Allergies (optional)
         self._allergies_input = QTextEdit()
         self._allergies_input.setPlaceholderText(_("Enter any allergies..."))
         self._allergies_input.setFixedHeight(ComponentHeight.TEXTAREA_SMALL)
-        form_layout.addRow(_("Allergies") + ":", self._allergies_input)
 
         # Tags (optional)
         self._tag_input = TagInput()
-        form_layout.addRow(_("Tags") + ":", self._tag_input)
+
+        # Form layout for fields
+        # WHY build rows first: Same as the add dialog, every widget is fully
+        # configured before the form is attached, so geometry is computed once
+        # WHY shared labels: The add dialog already caches the translated row
+        # labels per locale, so they are not rebuilt on every open
+        rows = [
+            ("first_name", self._first_name_input),
+            ("last_name", self._last_name_input),
+            ("email", self._email_input),
+            ("phone", self._phone_input),
+            ("address", self._address_input),
+            ("date_of_birth", self._dob_picker),
+            ("allergies", self._allergies_input),
+            ("tags", self._tag_input),
+        ]
+        labels = AddClientDialog._get_labels()
+
+        form_layout = QFormLayout()
+        form_layout.setSpacing(12)
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        for field, widget in rows:
+            form_layout.addRow(labels[field], widget)
 
         layout.addLayout(form_layout)
 
@@ -175,9 +189,7 @@ class EditClientDialog(BaseDialog):
         layout.addStretch()
 
         # Required fields note
-        required_note = QLabel(_("* Required fields"))
-        required_note.setProperty("form_note", True)  # CSS class (small, gray)
-        layout.addWidget(required_note)
+        self.create_form_note(layout, _("* Required fields"))
 
         # Button row: Delete + Save/Cancel
         button_row = QHBoxLayout()
@@ -218,23 +230,38 @@ class EditClientDialog(BaseDialog):
 
         This is called after the UI is created to fill in current values.
         """
-        # Set text fields
-        self._first_name_input.setText(self._client_data.get("first_name", ""))
-        self._last_name_input.setText(self._client_data.get("last_name", ""))
-        self._email_input.setText(self._client_data.get("email", ""))
-        self._phone_input.setText(self._client_data.get("phone", ""))
-        self._address_input.setPlainText(self._client_data.get("address", ""))
-        self._allergies_input.setPlainText(self._client_data.get("allergies", ""))
-
-        # Set date of birth
-        dob = self._client_data.get("date_of_birth")
-        if dob:
-            self._dob_picker.set_date(dob)
-
-        # Set tags
-        tags = self._client_data.get("tags", [])
-        if tags:
-            self._tag_input.set_tags(tags)
+        # Apply each non-empty value with its widget's setter
+        # WHY skip empty values: The widgets start out empty, so setting an
+        # empty string (or no date/tags) would only cost a redundant update
+        data = self._client_data
+        # How each client data key is written to its widget:
+        # (widget, setter, client data key)
+        fields: List[Tuple[QWidget, Callable[[Any], None], str]] = [
+            (self._first_name_input, self._first_name_input.setText, "first_name"),
+            (self._last_name_input, self._last_name_input.setText, "last_name"),
+            (self._email_input, self._email_input.setText, "email"),
+            (self._phone_input, self._phone_input.setText, "phone"),
+            (self._address_input, self._address_input.setPlainText, "address"),
+            (self._dob_picker, self._dob_picker.set_date, "date_of_birth"),
+            (self._allergies_input, self._allergies_input.setPlainText, "allergies"),
+            (self._tag_input, self._tag_input.set_tags, "tags"),
+        ]
+        widgets = [widget for widget, setter, key in fields]
+
+        # Block signals while filling in the stored values
+        # WHY: These are not user edits, so change signals (textChanged,
+        # date_changed, tags_changed) must not reach any connected slots
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            for widget, setter, key in fields:
+                value = data.get(key)
+                if value:
+                    setter(value)
+        finally:
+            # Re-enable signals
+            for widget in widgets:
+                widget.blockSignals(False)
 
     def accept(self) -> None:
         """
@@ -276,6 +303,11 @@ class EditClientDialog(BaseDialog):
         # Hide error if it was showing
         self.hide_error()
 
+        # Capture the result on accept
+        # WHY: get_client_data() then returns the values that were validated,
+        # without reading the widgets again
+        self._result = self._collect_data()
+
         # Accept dialog
         super().accept()
 
@@ -285,29 +317,40 @@ class EditClientDialog(BaseDialog):
 
         Shows confirmation dialog before marking client for deletion.
         """
-        # Get client name for confirmation message
-        first_name = self._client_data.get("first_name", "")
-        last_name = self._client_data.get("last_name", "")
-        client_name = f"{first_name} {last_name}".strip()
-
         # Show confirmation dialog
-        confirm = ConfirmDialog(
-            _("Delete Client"),
-            _("Are you sure you want to delete {client_name}?").format(
+        # WHY keep it: The message is fixed for this dialog, so when the user
+        # cancels and clicks Delete again the same confirmation is reused
+        # instead of building a new one
+        if self._confirm_dialog is None:
+            # Get client name for confirmation message
+            first_name = self._client_data.get("first_name", "")
+            last_name = self._client_data.get("last_name", "")
+            client_name = f"{first_name} {last_name}".strip()
+
+            question = _("Are you sure you want to delete {client_name}?").format(
                 client_name=client_name
             )
-            + "\n\n"
-            + _("This will also delete all associated treatment and product history.")
-            + "\n\n"
-            + _("This action cannot be undone."),
-            ok_text=_("Delete"),
-            cancel_text=_("Cancel"),
-            parent=self,
-            width=450,
-            height=250,
-        )
+            history_note = _(
+                "This will also delete all associated treatment and product history."
+            )
+            message = (
+                question
+                + "\n\n"
+                + history_note
+                + "\n\n"
+                + _("This action cannot be undone.")
+            )
+            self._confirm_dialog = ConfirmDialog(
+                _("Delete Client"),
+                message,
+                ok_text=_("Delete"),
+                cancel_text=_("Cancel"),
+                parent=self,
+                width=450,
+                height=250,
+            )
 
-        if confirm.exec() == QDialog.DialogCode.Accepted:
+        if self._confirm_dialog.exec() == QDialog.DialogCode.Accepted:
             # User confirmed deletion
             logger.debug(f"Client {self._client_id} marked for deletion")
             self._deleted = True
@@ -329,6 +372,24 @@ class EditClientDialog(BaseDialog):
         """
         return self._deleted
 
+    def _collect_data(self) -> dict:
+        """
+        Read the client data from the form fields.
+
+        Returns:
+            dict: Client data with the keys listed in get_client_data()
+        """
+        return {
+            "first_name": self._first_name_input.text().strip(),
+            "last_name": self._last_name_input.text().strip(),
+            "email": self._email_input.text().strip(),
+            "phone": self._phone_input.text().strip(),
+            "address": self._address_input.toPlainText().strip(),
+            "date_of_birth": self._dob_picker.get_date(),
+            "allergies": self._allergies_input.toPlainText().strip(),
+            "tags": self._tag_input.get_tags(),
+        }
+
     def get_client_data(self) -> dict:
         """
         Get the updated client data.
@@ -346,15 +407,10 @@ class EditClientDialog(BaseDialog):
 
         Note:
             This should only be called after the dialog is accepted
-            and was_deleted() returns False.
+            and was_deleted() returns False. The data captured on accept is
+            returned; before that it is read from the widgets.
         """
-        return {
-            "first_name": self._first_name_input.text().strip(),
-            "last_name": self._last_name_input.text().strip(),
-            "email": self._email_input.text().strip(),
-            "phone": self._phone_input.text().strip(),
-            "address": self._address_input.toPlainText().strip(),
-            "date_of_birth": self._dob_picker.get_date(),
-            "allergies": self._allergies_input.toPlainText().strip(),
-            "tags": self._tag_input.get_tags(),
-        }
+        if self._result is not None:
+            return self._result
+
+        return self._collect_data()
@@ -35,7 +35,6 @@ from PyQt6.QtWidgets import (
     QDialog,
     QFormLayout,
     QHBoxLayout,
-    QLabel,
     QLineEdit,
     QPushButton,
     QSpinBox,
@@ -46,6 +45,7 @@ from PyQt6.QtWidgets import (
 
 from .base_dialog import BaseDialog, ConfirmDialog
 from .add_inventory_dialog import get_units_for_system
+from ..constants import ComponentHeight
 from cosmetics_records.utils.localization import _
 
 # Configure module logger
@@ -63,10 +63,13 @@ class EditInventoryDialog(BaseDialog):
         _item_id: Database ID of the item being edited
         _item_data: Dictionary containing current item data
         _deleted: Flag indicating if item was deleted
+        _confirm_dialog: Delete confirmation, created on first use
+        _result: Item data captured when the dialog was accepted
         _name_input: QLineEdit for item name
         _description_input: QTextEdit for description
         _capacity_input: QSpinBox for capacity
         _unit_input: QComboBox for unit
+        _units: Unit texts in the order they appear in _unit_input
         _error_label: QLabel for displaying validation errors
     """
 
@@ -86,6 +89,8 @@ class EditInventoryDialog(BaseDialog):
         self._item_id = item_id
         self._item_data = item_data
         self._deleted = False
+        self._confirm_dialog: Optional[ConfirmDialog] = None
+        self._result: Optional[dict] = None
 
         # Initialize base dialog
         super().__init__(_("Edit Inventory Item"), parent, width=500, height=550)
@@ -108,21 +113,14 @@ class EditInventoryDialog(BaseDialog):
         # WHY use BaseDialog method: Ensures consistent styling across all dialogs
         self.create_error_label(layout)
 
-        # Form layout for fields
-        form_layout = QFormLayout()
-        form_layout.setSpacing(12)
-        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
-
         # Name (required)
         self._name_input = QLineEdit()
         self._name_input.setPlaceholderText(_("Enter item name..."))
-        form_layout.addRow(_("Name") + ": *", self._name_input)
 
         # Description (optional)
         self._description_input = QTextEdit()
         self._description_input.setPlaceholderText(_("Enter description..."))
-        self._description_input.setFixedHeight(80)
-        form_layout.addRow(_("Description") + ":", self._description_input)
+        self._description_input.setFixedHeight(ComponentHeight.TEXTAREA_MEDIUM)
 
         # Capacity and Unit on same row: [Capacity input] [Unit dropdown]
         capacity_row = QHBoxLayout()
@@ -145,9 +143,18 @@ class EditInventoryDialog(BaseDialog):
         if existing_unit and existing_unit not in units:
             units.insert(0, existing_unit)
         self._unit_input.addItems(units)
+        self._units = units
         self._unit_input.setFixedWidth(80)
         capacity_row.addWidget(self._unit_input)
 
+        # Form layout for fields
+        # WHY build rows last: As in the client dialogs, every widget is fully
+        # configured before it is placed in the form
+        form_layout = QFormLayout()
+        form_layout.setSpacing(12)
+        form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        form_layout.addRow(_("Name") + ": *", self._name_input)
+        form_layout.addRow(_("Description") + ":", self._description_input)
         form_layout.addRow(_("Capacity") + ": *", capacity_row)
 
         layout.addLayout(form_layout)
@@ -156,9 +163,7 @@ class EditInventoryDialog(BaseDialog):
         layout.addStretch()
 
         # Required fields note
-        required_note = QLabel(_("* Required fields"))
-        required_note.setProperty("form_note", True)  # CSS class (small, gray)
-        layout.addWidget(required_note)
+        self.create_form_note(layout, _("* Required fields"))
 
         # Button row: Delete + Save/Cancel
         button_row = QHBoxLayout()
@@ -199,22 +204,42 @@ class EditInventoryDialog(BaseDialog):
 
         This is called after the UI is created to fill in current values.
         """
-        # Set name
-        self._name_input.setText(self._item_data.get("name", ""))
-
-        # Set description
-        description = self._item_data.get("description", "")
-        self._description_input.setPlainText(description)
-
-        # Set capacity
-        capacity = self._item_data.get("capacity", 0)
-        self._capacity_input.setValue(capacity)
-
-        # Set unit
-        # NOTE: The unit is guaranteed to be in the dropdown because we add it
-        # in _create_content if it's not part of the current measurement system
-        unit = self._item_data.get("unit", "ml")
-        self._unit_input.setCurrentText(unit)
+        # Block signals while filling in the stored values
+        # WHY: These are not user edits, so change signals must not reach any
+        # connected slots
+        widgets = (
+            self._name_input,
+            self._description_input,
+            self._capacity_input,
+            self._unit_input,
+        )
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            # Set name
+            self._name_input.setText(self._item_data.get("name", ""))
+
+            # Set description
+            description = self._item_data.get("description", "")
+            self._description_input.setPlainText(description)
+
+            # Set capacity
+            capacity = self._item_data.get("capacity", 0)
+            self._capacity_input.setValue(capacity)
+
+            # Set unit
+            # NOTE: The unit is guaranteed to be in the dropdown because we add it
+            # in _create_content if it's not part of the current measurement system
+            # WHY select by index: The dropdown was filled from self._units, so the
+            # position is known here without Qt searching the item texts. A unit
+            # that is not listed keeps the first entry, like setCurrentText() did.
+            unit = self._item_data.get("unit", "ml")
+            if unit in self._units:
+                self._unit_input.setCurrentIndex(self._units.index(unit))
+        finally:
+            # Re-enable signals
+            for widget in widgets:
+                widget.blockSignals(False)
 
     def accept(self) -> None:
         """
@@ -243,6 +268,11 @@ class EditInventoryDialog(BaseDialog):
         # Hide error if it was showing
         self.hide_error()
 
+        # Capture the result on accept
+        # WHY: get_inventory_data() then returns the values that were validated,
+        # without reading the widgets again
+        self._result = self._collect_data()
+
         # Accept dialog
         super().accept()
 
@@ -252,23 +282,27 @@ class EditInventoryDialog(BaseDialog):
 
         Shows confirmation dialog before marking item for deletion.
         """
-        # Get item name for confirmation message
-        item_name = self._item_data.get("name", "this item")
-
         # Show confirmation dialog
-        confirm = ConfirmDialog(
-            _("Delete Inventory Item"),
-            _("Are you sure you want to delete '{name}'?").format(name=item_name)
-            + "\n\n"
-            + _("This action cannot be undone."),
-            ok_text=_("Delete"),
-            cancel_text=_("Cancel"),
-            parent=self,
-            width=450,
-            height=200,
-        )
-
-        if confirm.exec() == QDialog.DialogCode.Accepted:
+        # WHY keep it: The message is fixed for this dialog, so when the user
+        # cancels and clicks Delete again the same confirmation is reused
+        # instead of building a new one
+        if self._confirm_dialog is None:
+            # Get item name for confirmation message
+            item_name = self._item_data.get("name", "this item")
+
+            self._confirm_dialog = ConfirmDialog(
+                _("Delete Inventory Item"),
+                _("Are you sure you want to delete '{name}'?").format(name=item_name)
+                + "\n\n"
+                + _("This action cannot be undone."),
+                ok_text=_("Delete"),
+                cancel_text=_("Cancel"),
+                parent=self,
+                width=450,
+                height=200,
+            )
+
+        if self._confirm_dialog.exec() == QDialog.DialogCode.Accepted:
             # User confirmed deletion
             logger.debug(f"Inventory item {self._item_id} marked for deletion")
             self._deleted = True
@@ -289,6 +323,20 @@ class EditInventoryDialog(BaseDialog):
         """
         return self._deleted
 
+    def _collect_data(self) -> dict:
+        """
+        Read the item data from the form fields.
+
+        Returns:
+            dict: Item data with the keys listed in get_inventory_data()
+        """
+        return {
+            "name": self._name_input.text().strip(),
+            "description": self._description_input.toPlainText().strip(),
+            "capacity": self._capacity_input.value(),
+            "unit": self._unit_input.currentText(),
+        }
+
     def get_inventory_data(self) -> dict:
         """
         Get the updated inventory data.
@@ -302,11 +350,10 @@ class EditInventoryDialog(BaseDialog):
 
         Note:
             This should only be called after the dialog is accepted
-            and was_deleted() returns False.
+            and was_deleted() returns False. The data captured on accept is
+            returned; before that it is read from the widgets.
         """
-        return {
-            "name": self._name_input.text().strip(),
-            "description": self._description_input.toPlainText().strip(),
-            "capacity": self._capacity_input.value(),
-            "unit": self._unit_input.currentText(),
-        }
+        if self._result is not None:
+            return self._result
+
+        return self._collect_data()
@@ -37,12 +37,13 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from .add_product_record_dialog import QUANTITY_OPTIONS
 from .base_dialog import BaseDialog, ConfirmDialog
 from ..components.autocomplete import Autocomplete
 from ..components.date_picker import DatePicker
@@ -101,7 +102,7 @@ class EditProductRecordDialog(BaseDialog):
         # Populate fields with existing data
         self._populate_fields()
 
-        logger.debug(f"EditProductRecordDialog initialized for record {record_id}")
+        logger.debug("EditProductRecordDialog initialized for record %s", record_id)
 
     def _create_content(self, layout: QVBoxLayout) -> None:
         """
@@ -133,8 +134,7 @@ class EditProductRecordDialog(BaseDialog):
 
         # Quantity selector (1x-10x)
         self._quantity_combo = QComboBox()
-        for i in range(1, 11):
-            self._quantity_combo.addItem(f"{i}x")
+        self._quantity_combo.addItems(QUANTITY_OPTIONS)
         self._quantity_combo.setFixedWidth(70)
         self._quantity_combo.setProperty("quantity_selector", True)
         entry_row.addWidget(self._quantity_combo)
@@ -153,16 +153,17 @@ class EditProductRecordDialog(BaseDialog):
         layout.addLayout(entry_row)
 
         # Info note about free text
-        info_note = QLabel(_("Type to search inventory, or enter custom product name"))
-        info_note.setProperty("form_note", True)  # CSS class (small, gray)
-        info_note.setWordWrap(True)
-        layout.addWidget(info_note)
+        self.create_form_note(
+            layout, _("Type to search inventory, or enter custom product name")
+        )
 
         # Products text area (shows accumulated products)
         products_label = QLabel(_("Products:") + " *")
         layout.addWidget(products_label)
 
-        self._products_text = QTextEdit()
+        # WHY QPlainTextEdit: The product list is plain text, so the lighter
+        # plain text document is enough (same as AddProductRecordDialog)
+        self._products_text = QPlainTextEdit()
         self._products_text.setPlaceholderText(_("Added products will appear here..."))
         self._products_text.setMinimumHeight(120)
         layout.addWidget(self._products_text)
@@ -230,14 +231,11 @@ class EditProductRecordDialog(BaseDialog):
         # Get quantity
         quantity = self._quantity_combo.currentText()
 
-        # Add to products text
-        current_text = self._products_text.toPlainText()
+        # Append to products text
+        # WHY appendPlainText: Adds a single new line without reading back and
+        # re-laying out the whole list on every Add click
         new_line = f"{quantity} {product_name}"
-
-        if current_text:
-            self._products_text.setPlainText(f"{current_text}\n{new_line}")
-        else:
-            self._products_text.setPlainText(new_line)
+        self._products_text.appendPlainText(new_line)
 
         # Clear input for next product
         self._product_input.clear()
@@ -247,7 +245,7 @@ class EditProductRecordDialog(BaseDialog):
         # Hide error if showing
         self.hide_error()
 
-        logger.debug(f"Added product: {new_line}")
+        logger.debug("Added product: %s", new_line)
 
     def accept(self) -> None:
         """
@@ -277,7 +275,7 @@ class EditProductRecordDialog(BaseDialog):
             return
 
         # Validation passed
-        logger.debug(f"Saving changes to product record {self._record_id}")
+        logger.debug("Saving changes to product record %s", self._record_id)
 
         # Hide error if it was showing
         self.hide_error()
@@ -315,7 +313,7 @@ class EditProductRecordDialog(BaseDialog):
 
         if confirm.exec() == QDialog.DialogCode.Accepted:
             # User confirmed deletion
-            logger.debug(f"Product record {self._record_id} marked for deletion")
+            logger.debug("Product record %s marked for deletion", self._record_id)
             self._deleted = True
 
             # Close this dialog with Accepted status
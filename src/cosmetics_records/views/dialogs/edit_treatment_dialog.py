@@ -35,7 +35,6 @@ from PyQt6.QtWidgets import (
     QDialog,
     QFormLayout,
     QHBoxLayout,
-    QLabel,
     QPushButton,
     QTextEdit,
     QVBoxLayout,
@@ -89,7 +88,7 @@ class EditTreatmentDialog(BaseDialog):
         # Populate fields with existing data
         self._populate_fields()
 
-        logger.debug(f"EditTreatmentDialog initialized for treatment {treatment_id}")
+        logger.debug("EditTreatmentDialog initialized for treatment %s", treatment_id)
 
     def _create_content(self, layout: QVBoxLayout) -> None:
         """
@@ -125,9 +124,7 @@ class EditTreatmentDialog(BaseDialog):
         layout.addStretch()
 
         # Required fields note
-        required_note = QLabel(_("* Required fields"))
-        required_note.setProperty("form_note", True)  # CSS class (small, gray)
-        layout.addWidget(required_note)
+        self.create_form_note(layout, _("* Required fields"))
 
         # Button row: Delete + Save/Cancel
         button_row = QHBoxLayout()
@@ -197,7 +194,7 @@ class EditTreatmentDialog(BaseDialog):
             return
 
         # Validation passed
-        logger.debug(f"Saving changes to treatment {self._treatment_id}")
+        logger.debug("Saving changes to treatment %s", self._treatment_id)
 
         # Hide error if it was showing
         self.hide_error()
@@ -235,7 +232,7 @@ class EditTreatmentDialog(BaseDialog):
 
         if confirm.exec() == QDialog.DialogCode.Accepted:
             # User confirmed deletion
-            logger.debug(f"Treatment {self._treatment_id} marked for deletion")
+            logger.debug("Treatment %s marked for deletion", self._treatment_id)
             self._deleted = True
 
             # Close this dialog with Accepted status
@@ -41,12 +41,17 @@
 # =============================================================================
 
 import logging
-from typing import Callable, Optional, Tuple, TYPE_CHECKING
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from cosmetics_records.services.import_service import ImportPreview, ImportResult
+    from cosmetics_records.services.import_service import (
+        ImportPreview,
+        ImportResult,
+        ImportService,
+    )
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -59,12 +64,92 @@ from PyQt6.QtWidgets import (
 )
 
 from cosmetics_records.utils.localization import _
-from cosmetics_records.services.import_service import ImportService
 from .base_dialog import BaseDialog
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# CSV file kinds, in the order their rows are shown
+# WHY these names: "<kind>_path" is the matching validate_files() argument
+FILE_KINDS = ("clients", "treatments", "products", "inventory")
+
+# File type filter for the Browse file dialogs
+CSV_FILE_FILTER = "CSV Files (*.csv);;All Files (*)"
+
+# Status line for a record count, e.g. "• 150 clients"
+COUNT_LINE = "• {count} {label}"
+
+# Maximum number of validation errors listed in the status area
+# WHY cap: A badly malformed file can produce thousands of errors, and a
+# scroll area with thousands of labels becomes slow; the first errors are
+# enough to see what is wrong
+MAX_DISPLAYED_ERRORS = 200
+
+
+class ImportTaskSignals(QObject):
+    """
+    Signals emitted by a ValidateTask or ImportTask.
+
+    Signals:
+        finished(object): Emitted with the task result. For ValidateTask a
+                          tuple of (errors, preview), for ImportTask the
+                          ImportResult.
+    """
+
+    finished = pyqtSignal(object)
+
+
+class ValidateTask(QRunnable):
+    """
+    Background task that validates the selected CSV files.
+
+    Attributes:
+        signals: ImportTaskSignals used to report the result
+    """
+
+    def __init__(self, import_service: "ImportService", paths: dict):
+        """
+        Initialize the validate task.
+
+        Args:
+            import_service: Service used to validate the files
+            paths: Keyword arguments for ImportService.validate_files()
+        """
+        super().__init__()
+        self._import_service = import_service
+        self._paths = paths
+        self.signals = ImportTaskSignals()
+
+    def run(self) -> None:
+        """Validate the files and emit the errors and preview."""
+        errors = self._import_service.validate_files(**self._paths)
+        preview = None if errors else self._import_service.get_preview()
+        self.signals.finished.emit((errors, preview))
+
+
+class ImportTask(QRunnable):
+    """
+    Background task that imports the validated data.
+
+    Attributes:
+        signals: ImportTaskSignals used to report the result
+    """
+
+    def __init__(self, import_service: "ImportService"):
+        """
+        Initialize the import task.
+
+        Args:
+            import_service: Service holding the validated data
+        """
+        super().__init__()
+        self._import_service = import_service
+        self.signals = ImportTaskSignals()
+
+    def run(self) -> None:
+        """Import the data and emit the ImportResult."""
+        self.signals.finished.emit(self._import_service.import_data())
+
 
 class ImportDialog(BaseDialog):
     """
@@ -77,14 +162,45 @@ class ImportDialog(BaseDialog):
     4. Perform the import
 
     Attributes:
-        _import_service: Service for validation and import
-        _clients_path: Selected clients CSV path
-        _treatments_path: Selected treatments CSV path
-        _products_path: Selected products CSV path
-        _inventory_path: Selected inventory CSV path
+        _import_service: Service for validation and import, created on
+                         first use
+        _paths: Selected CSV path for each file kind (None if not selected)
+        _path_inputs: Path display for each file kind
         _validated: Whether validation has passed
+        _task: Validation or import running in the background, if any
+        _browse_buttons: Browse buttons, disabled while a task is running
+        _status_labels: Labels in the status area, reused between updates
     """
 
+    @classmethod
+    def _get_texts(cls) -> Dict[str, str]:
+        """
+        Get the translated status texts for the current locale.
+
+        Returns:
+            dict: Mapping of text key to its translated text
+        """
+        return cls._cached_texts(
+            lambda: {
+                "initial": _("Select files and click 'Validate' to check them."),
+                "preview": _("Validation passed! Ready to import:"),
+                "warning": _("Warning: This will add data to your database."),
+                "success": _("Import completed successfully!"),
+                "clients": _("clients"),
+                "treatments": _("treatments"),
+                "products": _("product sales"),
+                "inventory": _("inventory items"),
+                "row_clients": _("Clients:"),
+                "row_treatments": _("Treatments:"),
+                "row_products": _("Product Sales:"),
+                "row_inventory": _("Inventory:"),
+                "browse_clients": _("Select Clients CSV"),
+                "browse_treatments": _("Select Treatments CSV"),
+                "browse_products": _("Select Product Sales CSV"),
+                "browse_inventory": _("Select Inventory CSV"),
+            }
+        )
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the import dialog.
@@ -94,12 +210,13 @@ class ImportDialog(BaseDialog):
         """
         # Initialize state before calling super().__init__
         # which will call _create_content()
-        self._import_service = ImportService()
-        self._clients_path: Optional[str] = None
-        self._treatments_path: Optional[str] = None
-        self._products_path: Optional[str] = None
-        self._inventory_path: Optional[str] = None
+        self._import_service: Optional["ImportService"] = None
+        self._paths: Dict[str, Optional[str]] = dict.fromkeys(FILE_KINDS)
+        self._path_inputs: Dict[str, QLineEdit] = {}
         self._validated: bool = False
+        self._task: Optional[QRunnable] = None
+        self._browse_buttons: List[QPushButton] = []
+        self._status_labels: List[QLabel] = []
 
         # Call base class constructor (larger size for this dialog)
         super().__init__(
@@ -151,29 +268,15 @@ class ImportDialog(BaseDialog):
         instruction.setProperty("dialog_label", True)
         layout.addWidget(instruction)
 
-        # Clients row (no longer required)
-        clients_row, self._clients_input = self._create_file_row(
-            _("Clients:"), self._browse_clients
-        )
-        layout.addLayout(clients_row)
-
-        # Treatments row
-        treatments_row, self._treatments_input = self._create_file_row(
-            _("Treatments:"), self._browse_treatments
-        )
-        layout.addLayout(treatments_row)
-
-        # Product Sales row
-        products_row, self._products_input = self._create_file_row(
-            _("Product Sales:"), self._browse_products
-        )
-        layout.addLayout(products_row)
-
-        # Inventory row
-        inventory_row, self._inventory_input = self._create_file_row(
-            _("Inventory:"), self._browse_inventory
-        )
-        layout.addLayout(inventory_row)
+        # One row per file kind
+        # WHY partial: Binds the kind at creation, a lambda in the loop would
+        # see the last kind for every row
+        texts = self._get_texts()
+        for kind in FILE_KINDS:
+            row, self._path_inputs[kind] = self._create_file_row(
+                texts[f"row_{kind}"], partial(self._browse, kind)
+            )
+            layout.addLayout(row)
 
         # Add spacing
         layout.addSpacing(10)
@@ -222,6 +325,7 @@ class ImportDialog(BaseDialog):
         browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         browse_btn.clicked.connect(browse_callback)
         row_layout.addWidget(browse_btn)
+        self._browse_buttons.append(browse_btn)
 
         return row_layout, path_input
 
@@ -309,36 +413,17 @@ class ImportDialog(BaseDialog):
     # File Browse Handlers
     # =========================================================================
 
-    def _browse_clients(self) -> None:
-        """Open file dialog for clients CSV."""
-        path = self._open_file_dialog(_("Select Clients CSV"))
-        if path:
-            self._clients_path = path
-            self._clients_input.setText(path)
-            self._reset_validation()
-
-    def _browse_treatments(self) -> None:
-        """Open file dialog for treatments CSV."""
-        path = self._open_file_dialog(_("Select Treatments CSV"))
-        if path:
-            self._treatments_path = path
-            self._treatments_input.setText(path)
-            self._reset_validation()
-
-    def _browse_products(self) -> None:
-        """Open file dialog for product_sales CSV."""
-        path = self._open_file_dialog(_("Select Product Sales CSV"))
-        if path:
-            self._products_path = path
-            self._products_input.setText(path)
-            self._reset_validation()
+    def _browse(self, kind: str) -> None:
+        """
+        Open file dialog for the CSV of the given kind.
 
-    def _browse_inventory(self) -> None:
-        """Open file dialog for inventory CSV."""
-        path = self._open_file_dialog(_("Select Inventory CSV"))
+        Args:
+            kind: File kind, one of FILE_KINDS
+        """
+        path = self._open_file_dialog(self._get_texts()[f"browse_{kind}"])
         if path:
-            self._inventory_path = path
-            self._inventory_input.setText(path)
+            self._paths[kind] = path
+            self._path_inputs[kind].setText(path)
             self._reset_validation()
 
     def _open_file_dialog(self, title: str) -> Optional[str]:
@@ -355,7 +440,7 @@ class ImportDialog(BaseDialog):
             self,
             title,
             "",
-            "CSV Files (*.csv);;All Files (*)",
+            CSV_FILE_FILTER,
         )
         return path if path else None
 
@@ -371,15 +456,14 @@ class ImportDialog(BaseDialog):
 
     def _on_validate_clicked(self) -> None:
         """Handle Validate button click."""
+        # Ignore clicks while a validation or import is still running
+        # WHY: The buttons are disabled then, but a click that was already
+        # queued (e.g. a double-click) must not start a second run
+        if self._task is not None:
+            return
+
         # Check that at least one file is selected
-        if not any(
-            [
-                self._clients_path,
-                self._treatments_path,
-                self._products_path,
-                self._inventory_path,
-            ]
-        ):
+        if not any(self._paths.values()):
             self._update_status_error(
                 [_("Please select at least one CSV file to import")]
             )
@@ -387,13 +471,41 @@ class ImportDialog(BaseDialog):
 
         logger.info("Starting validation...")
 
-        # Run validation
-        errors = self._import_service.validate_files(
-            clients_path=self._clients_path,
-            treatments_path=self._treatments_path,
-            products_path=self._products_path,
-            inventory_path=self._inventory_path,
+        # Run validation in the background
+        # WHY: Parsing large CSV files takes a while, and the dialog should
+        # keep repainting in the meantime
+        task = ValidateTask(
+            self._get_import_service(),
+            {f"{kind}_path": path for kind, path in self._paths.items()},
         )
+        task.signals.finished.connect(self._on_validation_finished)
+        self._start_task(task, _("Validating..."))
+
+    def _get_import_service(self) -> "ImportService":
+        """
+        Get the import service, creating it on first use.
+
+        Returns:
+            ImportService: Service shared by all validations and the import
+        """
+        if self._import_service is None:
+            # WHY lazy import: The service module pulls in the models and
+            # database layer, which opening and cancelling the dialog
+            # doesn't need
+            from cosmetics_records.services.import_service import ImportService
+
+            self._import_service = ImportService()
+        return self._import_service
+
+    def _on_validation_finished(self, outcome: tuple) -> None:
+        """
+        Show the result of a background validation.
+
+        Args:
+            outcome: Tuple of (errors, preview) from the ValidateTask
+        """
+        self._finish_task()
+        errors, preview = outcome
 
         if errors:
             # Show errors
@@ -404,7 +516,6 @@ class ImportDialog(BaseDialog):
             logger.info(f"Validation failed with {len(errors)} errors")
         else:
             # Show preview
-            preview = self._import_service.get_preview()
             if preview is not None:
                 self._update_status_preview(preview)
             self._validated = True
@@ -413,17 +524,31 @@ class ImportDialog(BaseDialog):
 
     def _on_import_clicked(self) -> None:
         """Handle Import button click."""
-        if not self._validated:
+        if not self._validated or self._task is not None:
             return
 
         logger.info("Starting import...")
 
-        # Disable buttons during import
-        self._import_btn.setEnabled(False)
-        self._validate_btn.setEnabled(False)
+        # Perform import in the background
+        # WHY: Same as validation, the dialog stays responsive during the
+        # database writes
+        task = ImportTask(self._get_import_service())
+        task.signals.finished.connect(self._on_import_finished)
+        self._start_task(task, _("Importing..."))
 
-        # Perform import
-        result = self._import_service.import_data()
+    def _on_import_finished(self, result: "ImportResult") -> None:
+        """
+        Show the result of a background import.
+
+        Args:
+            result: ImportResult from the ImportTask
+        """
+        # WHY before _finish_task: It re-enables Import only while the data
+        # counts as validated, and after a failed import the data must be
+        # validated again before another attempt
+        if not result.success:
+            self._validated = False
+        self._finish_task()
 
         if result.success:
             # Show success message
@@ -435,53 +560,146 @@ class ImportDialog(BaseDialog):
         else:
             # Show error
             self._update_status_error([result.error_message or _("Import failed")])
-            self._validate_btn.setEnabled(True)
             logger.error(f"Import failed: {result.error_message}")
 
+    def _start_task(self, task: QRunnable, status_text: str) -> None:
+        """
+        Start a background task and lock the controls until it finishes.
+
+        Args:
+            task: ValidateTask or ImportTask to run
+            status_text: Status message shown while the task runs
+        """
+        self._task = task
+        self._set_controls_enabled(False)
+
+        self._show_status([(status_text, "muted")])
+
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_task(self) -> None:
+        """Release the controls after a background task has finished."""
+        self._task = None
+        self._set_controls_enabled(True)
+
+    def _set_controls_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the controls that would start or affect a task.
+
+        Args:
+            enabled: True to enable, False to disable
+        """
+        # WHY also Browse: Changing a file while it is validated would show
+        # a result for files that are no longer selected
+        for button in self._browse_buttons:
+            button.setEnabled(enabled)
+        self._validate_btn.setEnabled(enabled)
+        self._import_btn.setEnabled(enabled and self._validated)
+
+    def reject(self) -> None:
+        """Close the dialog, unless an import is still writing data."""
+        # WHY: Closing mid-import would hide whether the data was written
+        if isinstance(self._task, ImportTask):
+            return
+        super().reject()
+
     # =========================================================================
     # Status Display Updates
     # =========================================================================
 
-    def _clear_status(self) -> None:
-        """Clear all status messages."""
-        # Remove all widgets from status layout
-        while self._status_layout.count():
-            item = self._status_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+    def _show_status(self, lines: List[Tuple[str, str]]) -> None:
+        """
+        Show the given lines in the status area.
+
+        Labels are kept in a pool and reused between updates; labels that
+        are not needed for this update are hidden.
+
+        Args:
+            lines: List of (text, state) tuples, where state is the
+                   status_state theme property of the line
+        """
+        # WHY disable updates: The container is repainted and laid out once
+        # after all labels are set, instead of once per label
+        self._status_container.setUpdatesEnabled(False)
+        try:
+            self._set_status_lines(lines)
+        finally:
+            self._status_container.setUpdatesEnabled(True)
+
+    def _set_status_lines(self, lines: List[Tuple[str, str]]) -> None:
+        """
+        Set the status labels to the given lines (see _show_status).
+
+        Args:
+            lines: List of (text, state) tuples
+        """
+        # WHY reuse labels: Every validation and import would otherwise
+        # delete and recreate all status labels
+        for index, (text, state) in enumerate(lines):
+            if index < len(self._status_labels):
+                label = self._status_labels[index]
+            else:
+                label = QLabel()
+                label.setWordWrap(True)
+                self._status_layout.addWidget(label)
+                self._status_labels.append(label)
+
+            # Switch the theme rule only when the state actually changes
+            # WHY property + re-polish: Same as the backup dialog's status,
+            # the colors come from the theme and follow theme switches
+            if label.property("status_state") != state:
+                label.setProperty("status_state", state)
+                style = label.style()
+                if style:
+                    style.unpolish(label)
+                    style.polish(label)
+            label.setText(text)
+            label.show()
+
+        for label in self._status_labels[len(lines) :]:
+            label.hide()
 
     def _update_status_initial(self) -> None:
         """Show initial status message."""
-        self._clear_status()
-
-        label = QLabel(_("Select files and click 'Validate' to check them."))
-        label.setWordWrap(True)
-        label.setStyleSheet("color: #888888;")
-        self._status_layout.addWidget(label)
+        self._show_status([(self._get_texts()["initial"], "muted")])
 
     def _update_status_error(self, errors: list) -> None:
         """
         Show validation errors.
 
+        At most MAX_DISPLAYED_ERRORS errors are listed, followed by a line
+        with the number of errors not shown.
+
         Args:
             errors: List of error messages
         """
-        self._clear_status()
+        header = _("Validation failed ({count} errors):").format(count=len(errors))
+        lines = [(header, "error_header")]
+        lines.extend((f"• {error}", "error") for error in errors[:MAX_DISPLAYED_ERRORS])
 
-        # Error count header
-        header = QLabel(
-            _("Validation failed ({count} errors):").format(count=len(errors))
-        )
-        header.setStyleSheet("color: #ff6666; font-weight: bold;")
-        self._status_layout.addWidget(header)
+        hidden = len(errors) - MAX_DISPLAYED_ERRORS
+        if hidden > 0:
+            more = _("...and {count} more").format(count=hidden)
+            lines.append((more, "error"))
+
+        self._show_status(lines)
+
+    def _count_lines(self, counts: Tuple[int, ...]) -> List[Tuple[str, str]]:
+        """
+        Build the "• <count> <record type>" status lines.
+
+        Args:
+            counts: Record counts in FILE_KINDS order
 
-        # Error list
-        for error in errors:
-            error_label = QLabel(f"• {error}")
-            error_label.setWordWrap(True)
-            error_label.setStyleSheet("color: #ff6666;")
-            self._status_layout.addWidget(error_label)
+        Returns:
+            List of (text, style) lines for the non-zero counts
+        """
+        texts = self._get_texts()
+        return [
+            (COUNT_LINE.format(count=count, label=texts[kind]), "plain")
+            for kind, count in zip(FILE_KINDS, counts)
+            if count > 0
+        ]
 
     def _update_status_preview(self, preview: "ImportPreview") -> None:
         """
@@ -490,38 +708,26 @@ class ImportDialog(BaseDialog):
         Args:
             preview: ImportPreview with counts
         """
-        self._clear_status()
+        texts = self._get_texts()
 
         # Success header
-        header = QLabel(_("Validation passed! Ready to import:"))
-        header.setStyleSheet("color: #66ff66; font-weight: bold;")
-        self._status_layout.addWidget(header)
+        lines = [(texts["preview"], "ok_header")]
 
         # Counts
-        if preview.clients_count > 0:
-            label = QLabel(f"• {preview.clients_count} " + _("clients"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
-
-        if preview.treatments_count > 0:
-            label = QLabel(f"• {preview.treatments_count} " + _("treatments"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
-
-        if preview.products_count > 0:
-            label = QLabel(f"• {preview.products_count} " + _("product sales"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
-
-        if preview.inventory_count > 0:
-            label = QLabel(f"• {preview.inventory_count} " + _("inventory items"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
+        lines.extend(
+            self._count_lines(
+                (
+                    preview.clients_count,
+                    preview.treatments_count,
+                    preview.products_count,
+                    preview.inventory_count,
+                )
+            )
+        )
 
         # Warning
-        warning = QLabel(_("Warning: This will add data to your database."))
-        warning.setStyleSheet("color: #ffcc00; margin-top: 8px;")
-        self._status_layout.addWidget(warning)
+        lines.append((texts["warning"], "warning"))
+        self._show_status(lines)
 
     def _update_status_success(self, result: "ImportResult") -> None:
         """
@@ -530,41 +736,19 @@ class ImportDialog(BaseDialog):
         Args:
             result: ImportResult with counts
         """
-        self._clear_status()
-
         # Success header
-        header = QLabel(_("Import completed successfully!"))
-        header.setStyleSheet("color: #66ff66; font-weight: bold;")
-        self._status_layout.addWidget(header)
+        lines = [(self._get_texts()["success"], "ok_header")]
 
         # Counts
-        total = (
-            result.clients_imported
-            + result.treatments_imported
-            + result.products_imported
-            + result.inventory_imported
+        counts = (
+            result.clients_imported,
+            result.treatments_imported,
+            result.products_imported,
+            result.inventory_imported,
         )
 
-        summary = QLabel(_("Imported {total} records total:").format(total=total))
-        summary.setStyleSheet("color: #cccccc;")
-        self._status_layout.addWidget(summary)
-
-        if result.clients_imported > 0:
-            label = QLabel(f"• {result.clients_imported} " + _("clients"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
-
-        if result.treatments_imported > 0:
-            label = QLabel(f"• {result.treatments_imported} " + _("treatments"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
-
-        if result.products_imported > 0:
-            label = QLabel(f"• {result.products_imported} " + _("product sales"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
-
-        if result.inventory_imported > 0:
-            label = QLabel(f"• {result.inventory_imported} " + _("inventory items"))
-            label.setStyleSheet("color: #cccccc;")
-            self._status_layout.addWidget(label)
+        summary = _("Imported {total} records total:").format(total=sum(counts))
+        lines.append((summary, "plain"))
+        lines.extend(self._count_lines(counts))
+
+        self._show_status(lines)
@@ -34,12 +34,13 @@
 # =============================================================================
 
 import logging
-from typing import List, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PyQt6.QtGui import QMouseEvent
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QTimer, Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -62,7 +63,8 @@ class InventoryRow(QFrame):
     """
     Single inventory item row in the list.
 
-    Displays item name with capacity/unit and description preview.
+    Displays item name with capacity/unit and description preview. Rows are
+    reused for other items via bind() instead of being recreated.
 
     Signals:
         clicked(): Emitted when the row is clicked
@@ -105,12 +107,14 @@ class InventoryRow(QFrame):
 
         # Set up the UI
         self._init_ui()
+        self.bind(item_id, item_data)
 
     def _init_ui(self) -> None:
         """
         Initialize the user interface.
 
-        Creates a layout with name/capacity and description preview.
+        Creates a layout with name/capacity and description preview labels.
+        The labels are filled in by bind().
         """
         # Main vertical layout
         layout = QVBoxLayout(self)
@@ -118,28 +122,43 @@ class InventoryRow(QFrame):
         layout.setSpacing(4)
 
         # Item name with capacity/unit: "Hyaluronic Serum (30 ml)"
-        name = self.item_data.get("name", "")
-        capacity = self.item_data.get("capacity", 0)
-        unit = self.item_data.get("unit", "")
+        self._name_label = QLabel()
+        self._name_label.setProperty("inventory_name", True)  # CSS class (bold)
+        layout.addWidget(self._name_label)
 
-        # Format: "Name (capacity unit)"
-        name_with_capacity = f"{name} ({capacity} {unit})"
+        # Description preview (hidden for items without a description)
+        self._desc_label = QLabel()
+        self._desc_label.setProperty("inventory_description", True)  # CSS (gray)
+        layout.addWidget(self._desc_label)
+
+    def bind(self, item_id: int, item_data: dict) -> None:
+        """
+        Show the given item in this row.
+
+        Args:
+            item_id: Database ID of the inventory item
+            item_data: Dictionary with the same keys as for __init__
+        """
+        self.item_id = item_id
+        self.item_data = item_data
 
-        name_label = QLabel(name_with_capacity)
-        name_label.setProperty("inventory_name", True)  # CSS class (bold)
-        layout.addWidget(name_label)
+        # Format: "Name (capacity unit)"
+        name = item_data.get("name", "")
+        capacity = item_data.get("capacity", 0)
+        unit = item_data.get("unit", "")
+        self._name_label.setText(f"{name} ({capacity} {unit})")
 
         # Description preview (truncated)
-        description = self.item_data.get("description", "")
+        description = item_data.get("description", "")
         if description:
             # WHY 80 chars: Fits in row without wrapping in most cases
             truncated_desc = (
                 description[:80] + "..." if len(description) > 80 else description
             )
-
-            desc_label = QLabel(truncated_desc)
-            desc_label.setProperty("inventory_description", True)  # CSS class (gray)
-            layout.addWidget(desc_label)
+            self._desc_label.setText(truncated_desc)
+        else:
+            self._desc_label.clear()
+        self._desc_label.setVisible(bool(description))
 
     def mousePressEvent(self, event: Optional["QMouseEvent"]) -> None:
         """
@@ -170,6 +189,11 @@ class InventoryView(QWidget):
         _loaded_items: List of currently loaded item IDs
         _has_more: Whether more items are available to load
         _loading: Whether items are currently being loaded
+        _reload_timer: QTimer that coalesces rapid filter changes into one
+                       reload
+        _page_cache: Recently loaded pages by (search, filter, offset),
+                     least recently used first
+        _row_pool: Hidden rows from earlier loads, reused by add_items
     """
 
     # Signal
@@ -178,6 +202,21 @@ class InventoryView(QWidget):
     # Pagination settings
     ITEMS_PER_PAGE = 20
 
+    # Delay before the list is reloaded after a filter change (milliseconds)
+    # WHY: Clicking through several letters should only reload the list for
+    # the last one, instead of rebuilding it for every click
+    RELOAD_DELAY = 250
+
+    # Maximum number of loaded pages kept for reuse
+    # WHY 32: Covers going back and forth between a few letters/searches
+    # while holding at most a few hundred small dicts
+    MAX_CACHED_PAGES = 32
+
+    # Maximum number of hidden rows kept for reuse
+    # WHY: Scrolling far down creates many rows; beyond a few pages' worth
+    # they are deleted instead of being kept around hidden
+    MAX_POOLED_ROWS = 5 * ITEMS_PER_PAGE
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize the inventory view.
@@ -193,6 +232,18 @@ class InventoryView(QWidget):
         self._loaded_items: List[int] = []
         self._has_more: bool = True
         self._loading: bool = False
+        self._page_cache: "OrderedDict[Tuple[str, str, int], List[dict]]" = (
+            OrderedDict()
+        )
+        self._row_pool: List[InventoryRow] = []
+
+        # Reload timer for filter changes
+        # WHY setSingleShot(True): Restarted on each change, so a burst of
+        # changes results in a single reload once it settles
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.RELOAD_DELAY)
+        self._reload_timer.timeout.connect(self._reset_and_reload)
 
         # Set up the UI
         self._init_ui()
@@ -318,17 +369,21 @@ class InventoryView(QWidget):
         """
         Handle alphabet filter change.
 
-        Resets to first page and loads items starting with the selected letter.
+        Resets to first page and loads items starting with the selected letter
+        once the filter has stopped changing for RELOAD_DELAY.
 
         Args:
             letter: Selected letter ("All", "A"-"Z", or "#")
         """
         logger.debug(f"Filter changed: {letter}")
 
+        # Update the filter right away, only the reload is delayed
+        # WHY: Anything reading the filter (e.g. a search reload) in the
+        # meantime already uses the new letter
         self._current_filter = letter
 
-        # Reset and reload
-        self._reset_and_reload()
+        # Reset and reload once the changes settle
+        self._reload_timer.start()
 
     def _reset_and_reload(self) -> None:
         """
@@ -336,6 +391,9 @@ class InventoryView(QWidget):
 
         Clears all loaded items and loads the first page with current filters.
         """
+        # A pending delayed reload would only repeat this one
+        self._reload_timer.stop()
+
         # Clear current items
         self._clear_item_list()
 
@@ -350,6 +408,9 @@ class InventoryView(QWidget):
         """
         Remove all item rows from the UI.
 
+        Removed rows are hidden and kept in the row pool (up to
+        MAX_POOLED_ROWS) so add_items can reuse them.
+
         Note: Preserves the empty state label - only removes InventoryRow widgets.
         """
         # Collect widgets to remove (excluding empty state label)
@@ -360,10 +421,25 @@ class InventoryView(QWidget):
             if widget and widget != self._empty_state_label:
                 widgets_to_remove.append(widget)
 
-        # Remove and delete collected widgets
-        for widget in widgets_to_remove:
-            self._item_layout.removeWidget(widget)
-            widget.deleteLater()
+        # Remove collected widgets, keeping rows for reuse
+        # WHY pool: Re-binding a row only sets two label texts, while a new
+        # row has to build its widgets and resolve its stylesheet again
+        # WHY updates disabled: The container is repainted once after all
+        # rows are gone, instead of once per removed row
+        self._item_container.setUpdatesEnabled(False)
+        try:
+            for widget in widgets_to_remove:
+                self._item_layout.removeWidget(widget)
+                if (
+                    isinstance(widget, InventoryRow)
+                    and len(self._row_pool) < self.MAX_POOLED_ROWS
+                ):
+                    widget.hide()
+                    self._row_pool.append(widget)
+                else:
+                    widget.deleteLater()
+        finally:
+            self._item_container.setUpdatesEnabled(True)
 
     def _on_scroll_changed(self, value: int) -> None:
         """
@@ -374,12 +450,16 @@ class InventoryView(QWidget):
         Args:
             value: Current scroll position
         """
-        # Check if we're near the bottom
-        scrollbar = self._scroll_area.verticalScrollBar()
-        max_value = scrollbar.maximum()
+        # Check the flags first, they are the cheapest test
+        # WHY: This runs for every scroll step, and once all items are loaded
+        # (or a load is running) the scroll bar doesn't need to be queried
+        # NOTE: Not time-throttled, a skipped event at the bottom would leave
+        # the list without a load until the user scrolls again
+        if self._loading or not self._has_more:
+            return
 
         # Load more when within 100 pixels of bottom
-        if value >= max_value - 100 and not self._loading and self._has_more:
+        if value >= self._scroll_area.verticalScrollBar().maximum() - 100:
             self._load_more_items()
 
     def _load_initial_items(self) -> None:
@@ -411,6 +491,18 @@ class InventoryView(QWidget):
 
         self._loading = True
         offset = len(self._loaded_items)
+
+        # Reuse the page if it was loaded before with the same search/filter
+        # WHY: Switching back to a letter or retyping a search would otherwise
+        # query the same rows again
+        cache_key = (self._current_search, self._current_filter, offset)
+        cached_items = self._page_cache.get(cache_key)
+        if cached_items is not None:
+            self._page_cache.move_to_end(cache_key)
+            self.add_items(cached_items)
+            self._loading = False
+            return
+
         logger.debug(
             f"Loading items (offset: {offset}, "
             f"search: '{self._current_search}', filter: '{self._current_filter}')"
@@ -452,6 +544,11 @@ class InventoryView(QWidget):
                     }
                 )
 
+            # Remember the page, dropping the least recently used one if full
+            self._page_cache[cache_key] = item_dicts
+            if len(self._page_cache) > self.MAX_CACHED_PAGES:
+                self._page_cache.popitem(last=False)
+
             self.add_items(item_dicts)
             logger.debug(f"Loaded {len(items)} items from database")
 
@@ -500,18 +597,33 @@ class InventoryView(QWidget):
             # Hide empty state when we have items
             self._empty_state_label.setVisible(False)
 
-        for item_data in items:
-            item_id = item_data["id"]
+        # WHY updates disabled: Same as in _clear_item_list, the new rows are
+        # painted together once the whole page has been added
+        self._item_container.setUpdatesEnabled(False)
+        try:
+            for item_data in items:
+                item_id = item_data["id"]
 
-            # Create item row
-            item_row = InventoryRow(item_id, item_data)
-            item_row.clicked.connect(lambda iid=item_id: self._on_item_clicked(iid))
+                # Reuse a pooled row if there is one, else create a new row
+                if self._row_pool:
+                    item_row = self._row_pool.pop()
+                    item_row.bind(item_id, item_data)
+                else:
+                    item_row = InventoryRow(item_id, item_data)
+                    # WHY read item_id on click: The row may be re-bound to
+                    # another item later, the connection stays the same
+                    item_row.clicked.connect(
+                        lambda row=item_row: self._on_item_clicked(row.item_id)
+                    )
 
-            # Add to layout
-            self._item_layout.addWidget(item_row)
+                # Add to layout
+                self._item_layout.addWidget(item_row)
+                item_row.show()
 
-            # Track loaded item
-            self._loaded_items.append(item_id)
+                # Track loaded item
+                self._loaded_items.append(item_id)
+        finally:
+            self._item_container.setUpdatesEnabled(True)
 
         # Update pagination state
         # WHY: If we got fewer than a full page, we've reached the end
@@ -644,6 +756,9 @@ class InventoryView(QWidget):
         This should be called after adding/editing/deleting an item.
         """
         logger.debug("Refreshing inventory list")
+
+        # Cached pages may show items that changed
+        self._page_cache.clear()
         self._reset_and_reload()
 
     def get_current_search(self) -> str:
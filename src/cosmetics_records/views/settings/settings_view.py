@@ -71,10 +71,6 @@ from cosmetics_records.services.audit_service import AuditService
 from cosmetics_records.services.backup_service import BackupService
 from cosmetics_records.services.export_service import ExportService
 from cosmetics_records.utils.localization import _
-from cosmetics_records.views.dialogs.backup_management_dialog import (
-    BackupManagementDialog,
-)
-from cosmetics_records.views.dialogs.import_dialog import ImportDialog
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -1075,6 +1071,12 @@ class SettingsView(QWidget):
 
         Opens the backup management dialog for viewing, restoring, and deleting backups.
         """
+        # WHY local import: Dialog modules are only loaded when first opened,
+        # keeping them (and the import service) out of application startup
+        from cosmetics_records.views.dialogs.backup_management_dialog import (
+            BackupManagementDialog,
+        )
+
         logger.info("Opening backup management dialog...")
 
         dialog = BackupManagementDialog(parent=self)
@@ -1089,6 +1091,8 @@ class SettingsView(QWidget):
 
         Opens the import dialog for CSV data import.
         """
+        from cosmetics_records.views.dialogs.import_dialog import ImportDialog
+
         logger.info("Opening import dialog...")
 
         # Create and show import dialog
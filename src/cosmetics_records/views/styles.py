@@ -247,7 +247,7 @@ QLineEdit:disabled {{
    Text Edit (Multi-line)
    ========================================================================== */
 
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     background-color: {DARK_SURFACE};
     color: {DARK_TEXT};
     border: 1px solid {DARK_BORDER};
@@ -256,7 +256,7 @@ QTextEdit {{
     font-size: {sizes["body"]};
 }}
 
-QTextEdit:focus {{
+QTextEdit:focus, QPlainTextEdit:focus {{
     border: 1px solid {PRIMARY_BLUE};
 }}
 
@@ -647,6 +647,45 @@ QLabel[dialog_title="true"] {{
     color: {DARK_TEXT};
 }}
 
+/* Form notes - small gray hints below form fields */
+QLabel[form_note="true"] {{
+    color: {DARK_TEXT_SECONDARY};
+    font-size: {sizes["secondary"]};
+}}
+
+/* Status labels - muted by default, colored for results */
+QLabel[status_state="muted"] {{
+    color: {DARK_TEXT_SECONDARY};
+}}
+
+QLabel[status_state="plain"] {{
+    color: {DARK_TEXT};
+}}
+
+QLabel[status_state="ok"] {{
+    color: {SUCCESS_GREEN};
+}}
+
+QLabel[status_state="error"] {{
+    color: {ERROR_RED};
+}}
+
+QLabel[status_state="warning"] {{
+    color: {WARNING_ORANGE};
+    margin-top: 8px;
+}}
+
+/* Status headers - result colors in bold */
+QLabel[status_state="ok_header"] {{
+    color: {SUCCESS_GREEN};
+    font-weight: bold;
+}}
+
+QLabel[status_state="error_header"] {{
+    color: {ERROR_RED};
+    font-weight: bold;
+}}
+
 QPushButton[dialog_close="true"] {{
     background-color: transparent;
     color: {DARK_TEXT_SECONDARY};
@@ -1078,7 +1117,7 @@ QLineEdit:disabled {{
    Text Edit (Multi-line)
    ========================================================================== */
 
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     background-color: {LIGHT_SURFACE};
     color: {LIGHT_TEXT};
     border: 1px solid {LIGHT_BORDER};
@@ -1087,7 +1126,7 @@ QTextEdit {{
     font-size: {sizes["body"]};
 }}
 
-QTextEdit:focus {{
+QTextEdit:focus, QPlainTextEdit:focus {{
     border: 1px solid {PRIMARY_BLUE};
 }}
 
@@ -1472,6 +1511,45 @@ QLabel[dialog_title="true"] {{
     color: {LIGHT_TEXT};
 }}
 
+/* Form notes - small gray hints below form fields */
+QLabel[form_note="true"] {{
+    color: {LIGHT_TEXT_SECONDARY};
+    font-size: {sizes["secondary"]};
+}}
+
+/* Status labels - muted by default, colored for results */
+QLabel[status_state="muted"] {{
+    color: {LIGHT_TEXT_SECONDARY};
+}}
+
+QLabel[status_state="plain"] {{
+    color: {LIGHT_TEXT};
+}}
+
+QLabel[status_state="ok"] {{
+    color: {SUCCESS_GREEN};
+}}
+
+QLabel[status_state="error"] {{
+    color: {ERROR_RED};
+}}
+
+QLabel[status_state="warning"] {{
+    color: {WARNING_ORANGE};
+    margin-top: 8px;
+}}
+
+/* Status headers - result colors in bold */
+QLabel[status_state="ok_header"] {{
+    color: {SUCCESS_GREEN};
+    font-weight: bold;
+}}
+
+QLabel[status_state="error_header"] {{
+    color: {ERROR_RED};
+    font-weight: bold;
+}}
+
 QPushButton[dialog_close="true"] {{
     background-color: transparent;
     color: {LIGHT_TEXT_SECONDARY};
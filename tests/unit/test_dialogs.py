@@ -0,0 +1,303 @@
+# =============================================================================
+# Cosmetics Records - Dialog Unit Tests
+# =============================================================================
+# This file contains unit tests for dialog behavior that depends on Qt state
+# (enabled buttons, queued text updates, table models).
+#
+# Test Structure:
+#   - TestDialogTexts: Per-locale cache of translated dialog texts
+#   - TestBackupTableModel: Paging and row removal of the backup list model
+#   - TestAddProductRecordDialog: Queued product lines reach the result
+#   - TestEditClientDialog: Stored client data is shown in the form
+#   - TestImportDialog: Button state after background validation/import
+#
+# Testing Strategy:
+#   - Create real dialogs with the pytest-qt qtbot fixture
+#   - Call the task result handlers directly instead of running the tasks
+# =============================================================================
+
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+from PyQt6.QtCore import Qt
+
+from cosmetics_records.services.import_service import ImportResult
+from cosmetics_records.utils.localization import init_translations
+from cosmetics_records.views.dialogs.add_client_dialog import AddClientDialog
+from cosmetics_records.views.dialogs.add_product_record_dialog import (
+    AddProductRecordDialog,
+)
+from cosmetics_records.views.dialogs.add_treatment_dialog import AddTreatmentDialog
+from cosmetics_records.views.dialogs.backup_management_dialog import (
+    BackupManagementDialog,
+    BackupTableModel,
+)
+from cosmetics_records.views.dialogs.edit_client_dialog import EditClientDialog
+from cosmetics_records.views.dialogs.import_dialog import ImportDialog, ImportTask
+
+# =============================================================================
+# Dialog Text Cache Tests
+# =============================================================================
+
+
+class TestDialogTexts:
+    """Tests for BaseDialog._cached_texts()."""
+
+    def test_texts_built_once_per_locale(self):
+        """Test that texts are reused within a locale."""
+        init_translations("en")
+
+        first = AddClientDialog._get_labels()
+        second = AddClientDialog._get_labels()
+
+        assert first is second
+        assert first["first_name"] == "First Name: *"
+
+    def test_texts_follow_language_switch(self):
+        """Test that switching the language returns texts in that language."""
+        try:
+            init_translations("de")
+            german = AddClientDialog._get_labels()
+            init_translations("en")
+            english = AddClientDialog._get_labels()
+        finally:
+            init_translations("en")
+
+        assert german["first_name"] == "Vorname: *"
+        assert english["first_name"] == "First Name: *"
+
+    def test_texts_cached_per_dialog_class(self):
+        """Test that dialogs don't share each other's cached texts."""
+        init_translations("en")
+
+        client_labels = AddClientDialog._get_labels()
+        treatment_texts = AddTreatmentDialog._get_texts()
+
+        assert "first_name" in client_labels
+        assert "notes" in treatment_texts
+        assert "first_name" not in treatment_texts
+
+    def test_backup_dialog_texts_cached(self):
+        """Test that the backup dialog status texts go through the cache."""
+        init_translations("en")
+
+        first = BackupManagementDialog._get_texts()
+
+        assert BackupManagementDialog._get_texts() is first
+        assert first["no_selection"] == "No backup selected"
+
+
+# =============================================================================
+# Backup Table Model Tests
+# =============================================================================
+
+
+def _backup(index: int) -> dict:
+    """Build a backup info dict as returned by BackupService.get_backups()."""
+    return {
+        "filename": f"backup_{index:04d}.zip",
+        "path": f"/backups/backup_{index:04d}.zip",
+        "created": datetime(2024, 1, 1, 12, index % 60),
+        "size": 2048 + index,
+    }
+
+
+class TestBackupTableModel:
+    """Tests for BackupTableModel."""
+
+    def test_fetch_more_adds_one_page(self, qtbot, monkeypatch):
+        """Test that each fetchMore() exposes up to PAGE_SIZE more rows."""
+        monkeypatch.setattr(BackupTableModel, "PAGE_SIZE", 3)
+        model = BackupTableModel()
+        model.set_backups([_backup(i) for i in range(7)])
+
+        assert model.rowCount() == 3
+        assert model.canFetchMore()
+
+        model.fetchMore()
+        assert model.rowCount() == 6
+
+        # The last page only holds the remaining row
+        model.fetchMore()
+        assert model.rowCount() == 7
+        assert not model.canFetchMore()
+
+    def test_data_returns_formatted_columns(self, qtbot):
+        """Test that data() returns the prepared filename, date and size."""
+        model = BackupTableModel()
+        backup = _backup(5)
+        model.set_backups([backup])
+
+        def cell(column, role=Qt.ItemDataRole.DisplayRole):
+            return model.data(model.index(0, column), role)
+
+        assert cell(0) == "backup_0005.zip"
+        assert cell(1) == "2024-01-01 12:05"
+        assert cell(2) == "2.0 KB"
+        assert cell(0, Qt.ItemDataRole.UserRole) is backup
+
+    def test_remove_row_keeps_backup_at_aligned(self, qtbot):
+        """Test that backup_at() still matches the shown rows after removal."""
+        model = BackupTableModel()
+        backups = [_backup(i) for i in range(4)]
+        model.set_backups(list(backups))
+
+        model.remove_row(1)
+
+        assert model.rowCount() == 3
+        for row, backup in enumerate([backups[0], backups[2], backups[3]]):
+            assert model.backup_at(row) is backup
+            assert model.data(model.index(row, 0)) == backup["filename"]
+        assert model.backup_at(3) is None
+
+
+# =============================================================================
+# Add Product Record Dialog Tests
+# =============================================================================
+
+
+def _add_product(dialog: AddProductRecordDialog, name: str) -> None:
+    """Enter a product name and click Add."""
+    dialog._product_input.set_text(name)
+    dialog._on_add_product()
+
+
+class TestAddProductRecordDialog:
+    """Tests for the queued product lines of AddProductRecordDialog."""
+
+    def test_accept_before_flush_includes_all_products(self, qtbot):
+        """Test that products added right before accepting are saved."""
+        dialog = AddProductRecordDialog(1)
+        qtbot.addWidget(dialog)
+
+        for name in ("Retinol Serum", "Vitamin C Cream", "Eye Cream"):
+            _add_product(dialog, name)
+
+        # Accept before the flush timer has fired
+        assert dialog._flush_timer.isActive()
+        dialog.accept()
+
+        data = dialog.get_product_record_data()
+        assert data["product_text"].splitlines() == [
+            "1x Retinol Serum",
+            "1x Vitamin C Cream",
+            "1x Eye Cream",
+        ]
+        assert not dialog._pending_lines
+
+    def test_get_data_before_flush_includes_all_products(self, qtbot):
+        """Test that reading the data flushes queued products first."""
+        dialog = AddProductRecordDialog(1)
+        qtbot.addWidget(dialog)
+
+        _add_product(dialog, "Retinol Serum")
+        _add_product(dialog, "Eye Cream")
+
+        data = dialog.get_product_record_data()
+        assert data["product_text"] == "1x Retinol Serum\n1x Eye Cream"
+
+    def test_set_existing_record_discards_queued_products(self, qtbot):
+        """Test that loading a record drops products queued before it."""
+        dialog = AddProductRecordDialog(1)
+        qtbot.addWidget(dialog)
+
+        _add_product(dialog, "Leftover Cream")
+        dialog.set_existing_record(7, date(2024, 3, 1), "2x Retinol Serum")
+        dialog.accept()
+
+        data = dialog.get_product_record_data()
+        assert data["product_text"] == "2x Retinol Serum"
+        assert data["date"] == date(2024, 3, 1)
+
+
+# =============================================================================
+# Edit Client Dialog Tests
+# =============================================================================
+
+
+class TestEditClientDialog:
+    """Tests for populating EditClientDialog."""
+
+    def test_populate_fills_every_field(self, qtbot):
+        """Test that each stored client value is shown in its widget."""
+        client_data = {
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "email": "jane@example.com",
+            "phone": "+49 170 1234567",
+            "address": "Main Street 1",
+            "date_of_birth": date(1990, 5, 17),
+            "allergies": "Latex",
+            "tags": ["vip", "sensitive skin"],
+        }
+        dialog = EditClientDialog(3, client_data)
+        qtbot.addWidget(dialog)
+
+        assert dialog.get_client_data() == client_data
+
+    def test_populate_skips_missing_values(self, qtbot):
+        """Test that unset values leave their widgets empty."""
+        dialog = EditClientDialog(3, {"first_name": "Jane", "last_name": "Doe"})
+        qtbot.addWidget(dialog)
+
+        data = dialog.get_client_data()
+        assert data["email"] == ""
+        assert data["address"] == ""
+        assert data["date_of_birth"] is None
+        assert data["tags"] == []
+
+    def test_accept_captures_data(self, qtbot):
+        """Test that the data returned after accept is what was accepted."""
+        dialog = EditClientDialog(3, {"first_name": "Jane", "last_name": "Doe"})
+        qtbot.addWidget(dialog)
+
+        dialog._email_input.setText("  jane@example.com ")
+        dialog.accept()
+        # Later widget changes don't alter the accepted data
+        dialog._first_name_input.setText("Changed")
+
+        data = dialog.get_client_data()
+        assert data["first_name"] == "Jane"
+        assert data["email"] == "jane@example.com"
+
+
+# =============================================================================
+# Import Dialog Tests
+# =============================================================================
+
+
+class TestImportDialog:
+    """Tests for ImportDialog button state."""
+
+    def test_failed_import_keeps_import_disabled(self, qtbot):
+        """Test that Import stays disabled after a failed import."""
+        dialog = ImportDialog()
+        qtbot.addWidget(dialog)
+
+        # Validated data, import running
+        dialog._validated = True
+        dialog._task = ImportTask(MagicMock())
+        dialog._set_controls_enabled(False)
+
+        dialog._on_import_finished(
+            ImportResult(success=False, error_message="Database is locked")
+        )
+
+        # The data must be validated again before another attempt
+        assert dialog._validated is False
+        assert not dialog._import_btn.isEnabled()
+        assert dialog._validate_btn.isEnabled()
+        assert dialog._task is None
+
+    def test_status_lines_use_theme_states(self, qtbot):
+        """Test that status lines are styled via the status_state property."""
+        dialog = ImportDialog()
+        qtbot.addWidget(dialog)
+
+        dialog._update_status_error(["clients.csv: File not found"])
+
+        header, error = dialog._status_labels[:2]
+        assert header.property("status_state") == "error_header"
+        assert error.property("status_state") == "error"
+        assert header.styleSheet() == ""
+        assert error.styleSheet() == ""
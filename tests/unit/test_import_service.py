@@ -14,17 +14,20 @@
 #   Uses sample CSV files from tests/fixtures/import/
 # =============================================================================
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from cosmetics_records.database.connection import DatabaseConnection
+from cosmetics_records.services import import_service as import_service_module
 from cosmetics_records.services.import_service import (
     ImportService,
+    ParsedData,
     ValidationError,
 )
 
-
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -97,6 +100,20 @@ class TestFileValidation:
 
         assert len(errors) == 0
 
+    def test_validate_binary_file_rejected(self, import_service):
+        """Should reject a binary file (e.g. Excel) without parsing it."""
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+            f.write(b"PK\x03\x04\x00\x00binary")
+            path = f.name
+
+        try:
+            errors = import_service.validate_files(clients_path=path)
+        finally:
+            Path(path).unlink()
+
+        assert len(errors) == 1
+        assert "binary" in errors[0].message.lower()
+
 
 # =============================================================================
 # Validation Tests - Column Validation
@@ -339,6 +356,255 @@ class TestImport:
         pytest.skip("Integration test - requires proper database setup")
 
 
+# =============================================================================
+# Batched Import Tests
+# =============================================================================
+
+
+@pytest.fixture
+def import_db(temp_db, monkeypatch):
+    """
+    Point import_data() at a temporary database.
+
+    import_data() opens its own connections, so the module's
+    DatabaseConnection is replaced by one bound to the temporary file.
+
+    Yields:
+        str: Path to the temporary database file
+    """
+    monkeypatch.setattr(
+        import_service_module,
+        "DatabaseConnection",
+        lambda: DatabaseConnection(temp_db),
+    )
+    yield temp_db
+
+
+def _client_row(import_id: str) -> tuple:
+    """Build a parsed client row as produced by _parse_clients_csv()."""
+    return (
+        import_id,
+        {
+            "first_name": f"First{import_id}",
+            "last_name": f"Last{import_id}",
+            "email": None,
+            "phone": None,
+            "address": None,
+            "date_of_birth": None,
+            "allergies": None,
+            "tags": [],
+            "planned_treatment": None,
+            "notes": None,
+        },
+    )
+
+
+def _treatment_row(client_import_id: str, notes: str = "Facial") -> tuple:
+    """Build a parsed treatment row as produced by _parse_treatments_csv()."""
+    return (
+        client_import_id,
+        {"treatment_date": "2024-01-15", "treatment_notes": notes},
+    )
+
+
+def _inventory_row(index: int) -> dict:
+    """Build a parsed inventory row as produced by _parse_inventory_csv()."""
+    return {
+        "name": f"Item {index}",
+        "description": None,
+        "capacity": 30.0,
+        "unit": "ml",
+    }
+
+
+def _count_rows(db_path: str, table: str) -> int:
+    """Count the rows of a table in the given database."""
+    with DatabaseConnection(db_path) as db:
+        db.execute(f"SELECT COUNT(*) FROM {table}")
+        return db.fetchone()[0]
+
+
+class TestBatchedImport:
+    """Tests for the batched inserts done by import_data()."""
+
+    def test_import_counts_match_inserted_rows(
+        self,
+        import_service,
+        import_db,
+        sample_clients_path,
+        sample_treatments_path,
+        sample_product_sales_path,
+        sample_inventory_path,
+    ):
+        """Should report and insert one row per valid CSV row."""
+        errors = import_service.validate_files(
+            clients_path=sample_clients_path,
+            treatments_path=sample_treatments_path,
+            products_path=sample_product_sales_path,
+            inventory_path=sample_inventory_path,
+        )
+        assert errors == []
+        preview = import_service.get_preview()
+
+        result = import_service.import_data()
+
+        assert result.success
+        assert result.clients_imported == preview.clients_count
+        assert result.treatments_imported == preview.treatments_count
+        assert result.products_imported == preview.products_count
+        assert result.inventory_imported == preview.inventory_count
+        assert _count_rows(import_db, "clients") == result.clients_imported
+        assert _count_rows(import_db, "treatment_records") == (
+            result.treatments_imported
+        )
+        assert _count_rows(import_db, "product_records") == (result.products_imported)
+        assert _count_rows(import_db, "inventory") == result.inventory_imported
+
+    def test_import_skips_rows_with_unmapped_client(self, import_service, import_db):
+        """Should skip treatments whose client_import_id was not imported."""
+        import_service._parsed_data = ParsedData(
+            clients=[_client_row("1")],
+            treatments=[
+                _treatment_row("1"),
+                _treatment_row("missing"),
+                _treatment_row("1"),
+            ],
+        )
+
+        result = import_service.import_data()
+
+        assert result.success
+        assert result.treatments_imported == 2
+        assert _count_rows(import_db, "treatment_records") == 2
+
+    def test_import_larger_than_one_batch(self, import_service, import_db, monkeypatch):
+        """Should insert every row when the input spans several batches."""
+        monkeypatch.setattr(import_service_module, "IMPORT_BATCH_SIZE", 2)
+        import_service._parsed_data = ParsedData(
+            inventory=[_inventory_row(i) for i in range(5)],
+        )
+
+        executemany = DatabaseConnection.executemany
+        batch_sizes = []
+
+        def record_batch(db, query, rows):
+            batch_sizes.append(len(rows))
+            return executemany(db, query, rows)
+
+        monkeypatch.setattr(DatabaseConnection, "executemany", record_batch)
+
+        result = import_service.import_data()
+
+        assert result.success
+        assert result.inventory_imported == 5
+        assert batch_sizes == [2, 2, 1]
+        assert _count_rows(import_db, "inventory") == 5
+
+    def test_import_rolls_back_when_a_batch_fails(
+        self, import_service, import_db, monkeypatch
+    ):
+        """Should leave the database unchanged if an insert fails partway."""
+        monkeypatch.setattr(import_service_module, "IMPORT_BATCH_SIZE", 2)
+        import_service._parsed_data = ParsedData(
+            clients=[_client_row("1")],
+            # The third row violates NOT NULL and fails in the second batch
+            treatments=[
+                _treatment_row("1"),
+                _treatment_row("1"),
+                _treatment_row("1", notes=None),
+            ],
+            inventory=[_inventory_row(i) for i in range(3)],
+        )
+
+        result = import_service.import_data()
+
+        assert not result.success
+        assert result.error_message
+        assert _count_rows(import_db, "inventory") == 0
+        assert _count_rows(import_db, "clients") == 0
+        assert _count_rows(import_db, "treatment_records") == 0
+
+
+# =============================================================================
+# Validation Reuse Tests
+# =============================================================================
+
+
+@pytest.fixture
+def clients_copy(tmp_path, sample_clients_path):
+    """Copy of the sample clients CSV that tests may modify."""
+    path = tmp_path / "clients.csv"
+    path.write_bytes(Path(sample_clients_path).read_bytes())
+    return path
+
+
+@pytest.fixture
+def parse_calls(import_service, monkeypatch):
+    """Count how often the clients CSV is parsed."""
+    calls = []
+    parse = import_service._parse_clients_csv
+
+    def counting_parse():
+        calls.append(1)
+        return parse()
+
+    monkeypatch.setattr(import_service, "_parse_clients_csv", counting_parse)
+    return calls
+
+
+class TestValidationReuse:
+    """Tests for reusing the result when the validated files are unchanged."""
+
+    def test_unchanged_file_reuses_result(
+        self, import_service, clients_copy, parse_calls
+    ):
+        """Should not parse an unchanged file a second time."""
+        first = import_service.validate_files(clients_path=str(clients_copy))
+        second = import_service.validate_files(clients_path=str(clients_copy))
+
+        assert second == first
+        assert len(parse_calls) == 1
+
+    def test_modified_file_size_is_revalidated(
+        self, import_service, clients_copy, parse_calls
+    ):
+        """Should parse again when rows were added to the file."""
+        import_service.validate_files(clients_path=str(clients_copy))
+        count_before = import_service.get_preview().clients_count
+
+        with open(clients_copy, "a", encoding="utf-8") as f:
+            f.write("99,Extra,Client,,,,,,,,\n")
+        import_service.validate_files(clients_path=str(clients_copy))
+
+        assert len(parse_calls) == 2
+        assert import_service.get_preview().clients_count == count_before + 1
+
+    def test_modified_file_mtime_is_revalidated(
+        self, import_service, clients_copy, parse_calls
+    ):
+        """Should parse again when the file was rewritten with the same size."""
+        import_service.validate_files(clients_path=str(clients_copy))
+
+        stat = os.stat(clients_copy)
+        os.utime(clients_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        import_service.validate_files(clients_path=str(clients_copy))
+
+        assert len(parse_calls) == 2
+
+    def test_signature_cleared_after_successful_import(
+        self, import_service, import_db, clients_copy, parse_calls
+    ):
+        """Should validate again after the data has been imported."""
+        import_service.validate_files(clients_path=str(clients_copy))
+        result = import_service.import_data()
+        assert result.success
+        assert import_service._validated_signature is None
+
+        import_service.validate_files(clients_path=str(clients_copy))
+
+        assert len(parse_calls) == 2
+
+
 # =============================================================================
 # ValidationError Tests
 # =============================================================================
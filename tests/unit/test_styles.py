@@ -118,6 +118,27 @@ class TestGenerateThemes:
         # Light theme should contain light background color (#f5f5f5)
         assert "#f5f5f5" in stylesheet or "#ffffff" in stylesheet
 
+    def test_themes_style_all_status_states(self):
+        """
+        Test that both themes have a rule for every status label state.
+
+        Dialogs set these via the status_state property instead of inline
+        stylesheets, so a missing rule would leave the text unstyled.
+        """
+        states = (
+            "muted",
+            "plain",
+            "ok",
+            "error",
+            "warning",
+            "ok_header",
+            "error_header",
+        )
+
+        for stylesheet in (generate_dark_theme(), generate_light_theme()):
+            for state in states:
+                assert f'QLabel[status_state="{state}"]' in stylesheet
+
     def test_dark_theme_with_scale(self):
         """
         Test that generate_dark_theme() applies scaling to font sizes.
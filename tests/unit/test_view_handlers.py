@@ -17,12 +17,12 @@
 #   - Test both success and cancellation scenarios
 # =============================================================================
 
+from collections import OrderedDict
 from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-
 # Module path constants for patching (to keep lines under 88 chars)
 _CTRL_BASE = "cosmetics_records.controllers"
 INVENTORY_CTRL = f"{_CTRL_BASE}.inventory_controller.InventoryController"
@@ -600,6 +600,7 @@ class TestInventoryViewHandlers:
         view._current_search = ""
         view._current_filter = "All"
         view._has_more = True
+        view._page_cache = OrderedDict()
         view.add_items = MagicMock()
         view.ITEMS_PER_PAGE = 20
 
@@ -641,6 +642,7 @@ class TestInventoryViewHandlers:
         view._current_search = "Serum"
         view._current_filter = "All"
         view._has_more = True
+        view._page_cache = OrderedDict()
         view.add_items = MagicMock()
         view.ITEMS_PER_PAGE = 20
 
@@ -675,6 +677,30 @@ class TestInventoryViewHandlers:
         items_arg = view.add_items.call_args[0][0]
         assert len(items_arg) == 2
 
+    def test_load_more_items_uses_cached_page(self):
+        """Test that _load_more_items reuses a cached page without a query."""
+        from cosmetics_records.views.inventory.inventory_view import InventoryView
+
+        view = InventoryView.__new__(InventoryView)
+        view._loading = False
+        view._loaded_items = []
+        view._current_search = ""
+        view._current_filter = "A"
+        view._has_more = True
+        cached_items = [{"id": 1, "name": "Aloe Gel"}]
+        view._page_cache = OrderedDict([(("", "A", 0), cached_items)])
+        view.add_items = MagicMock()
+
+        with patch(
+            "cosmetics_records.database.connection.DatabaseConnection"
+        ) as mock_db_class:
+            view._load_more_items()
+
+        # Verify the cached page was shown without opening the database
+        mock_db_class.assert_not_called()
+        view.add_items.assert_called_once_with(cached_items)
+        assert view._loading is False
+
 
 # =============================================================================
 # Main Window Handler Tests
@@ -0,0 +1,105 @@
+# =============================================================================
+# Cosmetics Records - View Unit Tests
+# =============================================================================
+# This file contains unit tests for view behavior that depends on Qt state
+# (which row widgets are shown, what they emit).
+#
+# Test Structure:
+#   - TestInventoryRowPool: Reuse of InventoryRow widgets across reloads
+#
+# Testing Strategy:
+#   - Create real views with the pytest-qt qtbot fixture
+#   - Replace the database page loading with fixed pages of item dicts
+# =============================================================================
+
+import pytest
+
+from cosmetics_records.views.inventory.inventory_view import (
+    InventoryRow,
+    InventoryView,
+)
+
+
+def _item(item_id: int, description: str = "") -> dict:
+    """Build an item dict as passed to InventoryView.add_items()."""
+    return {
+        "id": item_id,
+        "name": f"Item {item_id}",
+        "capacity": 30,
+        "unit": "ml",
+        "description": description,
+    }
+
+
+@pytest.fixture
+def inventory_view(qtbot, monkeypatch):
+    """
+    Create an InventoryView that loads the pages listed in view.pages.
+
+    Each load (initial load, refresh) shows the next page instead of
+    querying the database.
+    """
+    pages = []
+
+    def load_next_page(view):
+        view.add_items(pages.pop(0))
+
+    monkeypatch.setattr(InventoryView, "_load_more_items", load_next_page)
+    pages.append([_item(1, "Rich night cream"), _item(2, "Light day cream")])
+
+    view = InventoryView()
+    qtbot.addWidget(view)
+    view.pages = pages
+    return view
+
+
+def _shown_rows(view: InventoryView) -> list:
+    """Get the row widgets currently shown in the list, in order."""
+    layout = view._item_layout
+    rows = [layout.itemAt(i).widget() for i in range(layout.count())]
+    return [row for row in rows if isinstance(row, InventoryRow)]
+
+
+class TestInventoryRowPool:
+    """Tests for reusing InventoryRow widgets across reloads."""
+
+    def test_pooled_row_emits_new_item_id(self, inventory_view, monkeypatch):
+        """Test that a re-bound row reports the item it shows now."""
+        first_rows = _shown_rows(inventory_view)
+
+        inventory_view.pages.append([_item(10), _item(11)])
+        inventory_view.refresh()
+
+        rows = _shown_rows(inventory_view)
+        assert [row.item_id for row in rows] == [10, 11]
+        # The rows were reused, not recreated
+        assert set(rows) == set(first_rows)
+
+        clicked = []
+        monkeypatch.setattr(inventory_view, "_on_item_clicked", clicked.append)
+        for row in rows:
+            row.clicked.emit()
+
+        assert clicked == [10, 11]
+
+    def test_pooled_row_hides_missing_description(self, inventory_view):
+        """Test that a re-bound row hides the old item's description."""
+        inventory_view.pages.append([_item(10), _item(11, "Gentle cleanser")])
+        inventory_view.refresh()
+
+        without_desc, with_desc = _shown_rows(inventory_view)
+        assert without_desc._desc_label.isHidden()
+        assert without_desc._desc_label.text() == ""
+        assert not with_desc._desc_label.isHidden()
+        assert with_desc._desc_label.text() == "Gentle cleanser"
+        assert with_desc._name_label.text() == "Item 11 (30 ml)"
+
+    def test_pool_is_bounded(self, inventory_view, monkeypatch):
+        """Test that rows beyond MAX_POOLED_ROWS are not kept."""
+        monkeypatch.setattr(InventoryView, "MAX_POOLED_ROWS", 1)
+
+        inventory_view.pages.append([])
+        inventory_view.refresh()
+
+        assert len(inventory_view._row_pool) == 1
+        assert _shown_rows(inventory_view) == []